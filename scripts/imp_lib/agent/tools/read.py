@@ -16,12 +16,12 @@ def get_module_config_dict(config, module_name: str) -> dict:
     Returns:
         Module config dict or empty dict if not found/disabled
     """
-    if not config or not hasattr(config, 'modules'):
+    if not config:
         return {}
 
-    for m in config.modules:
-        if m.get('name') == module_name and m.get('enabled'):
-            return m.get('config', {})
+    m = config.get_module(module_name)
+    if m and m.get('enabled'):
+        return m.get('config', {})
     return {}
 
 
@@ -32,13 +32,9 @@ def find_module(config, module_name: str) -> dict:
     Returns:
         Module dict or None if not found
     """
-    if not config or not hasattr(config, 'modules'):
+    if not config:
         return None
-
-    for m in config.modules:
-        if m.get('name') == module_name:
-            return m
-    return None
+    return config.get_module(module_name)
 
 
 # =============================================================================
@@ -269,7 +265,7 @@ def tool_list_modules(config) -> str:
 
     # Get enabled modules from config
     enabled_modules = {}
-    if config and hasattr(config, 'modules'):
+    if config:
         for m in config.modules:
             if m.get('name'):
                 enabled_modules[m['name']] = m.get('enabled', False)
@@ -385,12 +381,12 @@ def tool_execute_module_command(config, ctx, module_name: str, command_path: str
     module = find_module(config, module_name)
     if not module:
         # Create the module entry
-        config.modules.append({
+        module = {
             'name': module_name,
             'enabled': True,
             'config': {}
-        })
-        module = config.modules[-1]
+        }
+        config.add_module(module)
     elif not module.get('enabled'):
         module['enabled'] = True
 
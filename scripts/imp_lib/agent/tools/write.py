@@ -94,7 +94,7 @@ def tool_add_subinterface(config, ctx, interface: str, vlan_id: int,
         return "Error: VLAN ID must be between 1 and 4094"
 
     # Check for duplicate
-    if any(s.vlan_id == vlan_id for s in parent.subinterfaces):
+    if parent.get_subinterface(vlan_id):
         return f"Error: Sub-interface .{vlan_id} already exists on {parent_name}"
 
     # Validate and parse IPs
@@ -123,7 +123,7 @@ def tool_add_subinterface(config, ctx, interface: str, vlan_id: int,
         ipv6_prefix=ipv6_prefix,
         create_lcp=create_lcp
     )
-    parent.subinterfaces.append(subif)
+    parent.add_subinterface(subif)
     ctx.dirty = True
 
     ips = []
@@ -142,11 +142,11 @@ def tool_delete_subinterface(config, ctx, interface: str, vlan_id: int) -> str:
         available = [i.name for i in config.interfaces]
         return f"Interface '{interface}' not found. Available: {', '.join(available)}"
 
-    sub = next((s for s in parent.subinterfaces if s.vlan_id == vlan_id), None)
+    sub = parent.get_subinterface(vlan_id)
     if not sub:
         return f"Sub-interface .{vlan_id} not found on {parent_name}"
 
-    parent.subinterfaces.remove(sub)
+    parent.remove_subinterface(sub)
     ctx.dirty = True
     return f"Deleted {parent_name}.{vlan_id}"
 
@@ -159,10 +159,7 @@ def tool_add_loopback(config, ctx, name: str, ipv4_cidr: str = None,
         return "Error: Configuration module not available"
 
     # Find next available instance
-    used_instances = {lo.instance for lo in config.loopbacks}
-    instance = 0
-    while instance in used_instances:
-        instance += 1
+    instance = config.next_loopback_instance()
 
     # Validate and parse IPs
     ipv4, ipv4_prefix = None, None
@@ -191,7 +188,7 @@ def tool_add_loopback(config, ctx, name: str, ipv4_cidr: str = None,
         ipv6_prefix=ipv6_prefix,
         create_lcp=create_lcp
     )
-    config.loopbacks.append(loopback)
+    config.add_loopback(loopback)
     ctx.dirty = True
 
     ips = []
@@ -217,12 +214,12 @@ def tool_delete_loopback(config, ctx, name: str) -> str:
         except ValueError:
             return f"Error: Invalid loopback: {name} (use 'loop0' or '0')"
 
-    lo = next((l for l in config.loopbacks if l.instance == instance), None)
+    lo = config.get_loopback(instance)
     if not lo:
         available = ", ".join(f"loop{l.instance}" for l in config.loopbacks)
         return f"Loopback loop{instance} not found (available: {available})"
 
-    config.loopbacks.remove(lo)
+    config.remove_loopback(lo)
     ctx.dirty = True
     return f"Deleted loop{instance} ({lo.name})"
 
@@ -241,16 +238,16 @@ def tool_add_vlan_passthrough(config, ctx, vlan_id: int, from_interface: str,
     available = [i.name for i in config.interfaces]
 
     # Check interfaces exist
-    if not any(i.name == from_interface for i in config.interfaces):
+    if not config.get_interface(from_interface):
         return f"Interface '{from_interface}' not found. Available: {', '.join(available)}"
-    if not any(i.name == to_interface for i in config.interfaces):
+    if not config.get_interface(to_interface):
         return f"Interface '{to_interface}' not found. Available: {', '.join(available)}"
 
     # Check for duplicate
-    if any(v.vlan_id == vlan_id for v in config.vlan_passthrough):
+    if config.get_vlan_passthrough(vlan_id):
         return f"Error: VLAN passthrough {vlan_id} already exists"
 
-    config.vlan_passthrough.append(classes['VLANPassthrough'](
+    config.add_vlan_passthrough(classes['VLANPassthrough'](
         vlan_id=vlan_id,
         from_interface=from_interface,
         to_interface=to_interface,
@@ -262,11 +259,11 @@ def tool_add_vlan_passthrough(config, ctx, vlan_id: int, from_interface: str,
 
 def tool_delete_vlan_passthrough(config, ctx, vlan_id: int) -> str:
     """Delete a VLAN passthrough rule."""
-    vlan = next((v for v in config.vlan_passthrough if v.vlan_id == vlan_id), None)
+    vlan = config.get_vlan_passthrough(vlan_id)
     if not vlan:
         return f"VLAN passthrough {vlan_id} not found"
 
-    config.vlan_passthrough.remove(vlan)
+    config.remove_vlan_passthrough(vlan)
     ctx.dirty = True
     return f"Deleted VLAN passthrough {vlan_id}"
 
@@ -291,7 +288,7 @@ def tool_add_route(config, ctx, destination: str, via: str, interface: str = Non
 
     # Check interface exists if specified
     if interface:
-        if not any(i.name == interface for i in config.interfaces):
+        if not config.get_interface(interface):
             available = [i.name for i in config.interfaces]
             return f"Interface '{interface}' not found. Available: {', '.join(available)}"
 
@@ -360,9 +357,8 @@ def tool_add_bgp_peer(config, ctx, name: str, peer_ip: str, peer_asn: int,
         return f"Error: Invalid peer IP address: {e}"
 
     # Check for duplicate
-    for p in config.bgp.peers:
-        if p.peer_ip == peer_ip:
-            return f"Error: Peer {peer_ip} already exists"
+    if config.bgp.get_peer(peer_ip):
+        return f"Error: Peer {peer_ip} already exists"
 
     BGPPeer = classes['BGPPeer']
     peer = BGPPeer(
@@ -371,7 +367,7 @@ def tool_add_bgp_peer(config, ctx, name: str, peer_ip: str, peer_asn: int,
         peer_asn=peer_asn,
         description=description or name
     )
-    config.bgp.peers.append(peer)
+    config.bgp.add_peer(peer)
     ctx.dirty = True
 
     return f"Added {af} BGP peer: {name} ({peer_ip}) AS {peer_asn}"
@@ -382,13 +378,13 @@ def tool_remove_bgp_peer(config, ctx, peer_ip: str) -> str:
     if not config.bgp.enabled:
         return "Error: BGP is not enabled"
 
-    for p in config.bgp.peers:
-        if p.peer_ip == peer_ip:
-            config.bgp.peers.remove(p)
-            ctx.dirty = True
-            return f"Removed BGP peer {peer_ip}"
+    p = config.bgp.get_peer(peer_ip)
+    if not p:
+        return f"Error: Peer {peer_ip} not found"
 
-    return f"Error: Peer {peer_ip} not found"
+    config.bgp.remove_peer(p)
+    ctx.dirty = True
+    return f"Removed BGP peer {peer_ip}"
 
 
 def tool_disable_bgp(config, ctx) -> str:
@@ -397,7 +393,7 @@ def tool_disable_bgp(config, ctx) -> str:
         return "BGP is already disabled"
 
     config.bgp.enabled = False
-    config.bgp.peers = []  # Clear all peers
+    config.bgp.clear_peers()  # Clear all peers
     config.bgp.announced_prefixes = []  # Clear all prefixes
     ctx.dirty = True
     return "Disabled BGP and removed all peers and announced prefixes"
@@ -7,10 +7,10 @@ This module provides:
 - prompts: Interactive prompt utilities
 """
 
-from .colors import Colors, log, warn, error, info, tool_log
-from .vpp import get_vpp_socket, get_available_vpp_instances, vpp_exec
+from .colors import Colors, use_color, set_color, log, warn, error, info, tool_log
+from .vpp import get_vpp_socket, get_available_vpp_instances, vpp_exec, vpp_exec_stream
 
 __all__ = [
-    'Colors', 'log', 'warn', 'error', 'info', 'tool_log',
-    'get_vpp_socket', 'get_available_vpp_instances', 'vpp_exec',
+    'Colors', 'use_color', 'set_color', 'log', 'warn', 'error', 'info', 'tool_log',
+    'get_vpp_socket', 'get_available_vpp_instances', 'vpp_exec', 'vpp_exec_stream',
 ]
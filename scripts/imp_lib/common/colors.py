@@ -2,9 +2,17 @@
 ANSI color codes and logging utilities for IMP CLI tools.
 """
 
+import sys
+from typing import Optional, TextIO
+
 
 class Colors:
-    """ANSI color escape codes for terminal output."""
+    """
+    ANSI color escape codes for terminal output.
+
+    The codes are plain attributes; set_color() blanks or restores them for an
+    output scope. Set Colors.enabled to True/False to force colors on or off.
+    """
     RED = "\033[0;31m"
     GREEN = "\033[0;32m"
     YELLOW = "\033[1;33m"
@@ -14,6 +22,35 @@ class Colors:
     DIM = "\033[2m"
     NC = "\033[0m"  # No Color / Reset
 
+    enabled: Optional[bool] = None
+
+
+_CODES = {name: code for name, code in vars(Colors).items() if name.isupper()}
+
+
+def use_color(stream: Optional[TextIO] = None) -> bool:
+    """Whether ANSI colors should be written to stream (default: current sys.stdout)."""
+    if Colors.enabled is not None:
+        return Colors.enabled
+    if stream is None:
+        stream = sys.stdout
+    # sys.stdout/sys.stderr are None under pythonw and some detached daemons
+    if stream is None:
+        return False
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def set_color(on: bool) -> bool:
+    """Turn the Colors codes on or off. Returns the previous state for restoring."""
+    previous = Colors.NC != ""
+    if on != previous:
+        for name, code in _CODES.items():
+            setattr(Colors, name, code if on else "")
+    return previous
+
 
 def log(msg: str) -> None:
     """Log a success/info message in green."""
@@ -5,9 +5,14 @@ Provides functions for executing commands against VPP instances
 via their CLI sockets.
 """
 
+import os
+import signal
 import subprocess
+import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, List
+from typing import Iterator, Optional, Tuple, List
 
 
 def get_vpp_socket(instance: str) -> str:
@@ -23,22 +28,37 @@ def get_vpp_socket(instance: str) -> str:
     return f"/run/vpp/{instance}-cli.sock"
 
 
-def get_available_vpp_instances() -> List[str]:
+def get_available_vpp_instances(tick: Optional[int] = None) -> List[str]:
     """
     Get list of available VPP instances by scanning socket files.
 
+    Args:
+        tick: Optional REPL prompt tick; scans with the same tick share one result
+
     Returns:
         Sorted list of instance names (e.g., ["core", "nat"])
     """
-    instances = []
-    vpp_dir = Path("/run/vpp")
-    if vpp_dir.exists():
-        for sock in vpp_dir.glob("*-cli.sock"):
-            name = sock.name.replace("-cli.sock", "")
-            instances.append(name)
+    if tick is not None:
+        return list(_scan_vpp_instances_at(tick))
+    return _scan_vpp_instances()
+
+
+def _scan_vpp_instances() -> List[str]:
+    # Match on the entry name only; no per-entry stat is needed
+    try:
+        with os.scandir("/run/vpp") as entries:
+            instances = [e.name[:-len("-cli.sock")] for e in entries if e.name.endswith("-cli.sock")]
+    except FileNotFoundError:
+        return []
     return sorted(instances)
 
 
+@lru_cache(maxsize=1)
+def _scan_vpp_instances_at(tick: int) -> Tuple[str, ...]:
+    # Only the current tick is kept, so a new prompt always rescans
+    return tuple(_scan_vpp_instances())
+
+
 def vpp_exec(command: str, instance: str = "core") -> Tuple[bool, str]:
     """
     Execute a VPP CLI command and capture output.
@@ -74,3 +94,68 @@ def vpp_exec(command: str, instance: str = "core") -> Tuple[bool, str]:
         return False, "Command timed out"
     except Exception as e:
         return False, str(e)
+
+
+def _kill_group(proc: subprocess.Popen) -> None:
+    # Kill the whole session so no helper keeps the stdout pipe open
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def vpp_exec_stream(command: str, instance: str = "core", timeout: float = 30) -> Iterator[str]:
+    """
+    Execute a VPP CLI command and yield its output line by line.
+
+    For large outputs (e.g. "show trace") that only need to be scanned,
+    this avoids holding the whole response in memory.
+
+    Args:
+        command: VPP CLI command to execute
+        instance: VPP instance name (default: "core")
+        timeout: Seconds before vppctl is killed, as in vpp_exec
+
+    Yields:
+        Output lines, including trailing newlines
+
+    Raises:
+        OSError: If vppctl cannot be started
+        RuntimeError: If vppctl times out or exits non-zero with an error message
+    """
+    socket = get_vpp_socket(instance)
+    # stderr goes to a file so a chatty vppctl can never block on a full pipe
+    with tempfile.TemporaryFile(mode="w+") as err:
+        proc = subprocess.Popen(
+            ["vppctl", "-s", socket, command],
+            stdout=subprocess.PIPE,
+            stderr=err,
+            text=True,
+            start_new_session=True
+        )
+        # Reads on stdout block, so the deadline is enforced by killing the child
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            _kill_group(proc)
+
+        deadline = threading.Timer(timeout, expire)
+        deadline.daemon = True
+        deadline.start()
+        try:
+            yield from proc.stdout
+            returncode = proc.wait()
+        finally:
+            # Also reached when the consumer stops iterating early
+            deadline.cancel()
+            if proc.poll() is None:
+                _kill_group(proc)
+            proc.wait()
+            proc.stdout.close()
+        if timed_out.is_set():
+            raise RuntimeError("Command timed out")
+        err.seek(0)
+        stderr = err.read().strip()
+        if returncode != 0 and stderr:
+            raise RuntimeError(stderr)
@@ -132,6 +132,23 @@ class Interface:
     ipv6_ra_suppress: bool = False  # Suppress RAs (keep config but don't send)
     ipv6_ra_prefixes: list[str] = field(default_factory=list)  # Custom prefixes (empty = auto from IPv6)
 
+    def __post_init__(self):
+        self._subinterfaces_by_vlan = {s.vlan_id: s for s in self.subinterfaces}
+
+    def get_subinterface(self, vlan_id: int) -> Optional[SubInterface]:
+        """Look up a sub-interface by VLAN ID."""
+        return self._subinterfaces_by_vlan.get(vlan_id)
+
+    def add_subinterface(self, sub: SubInterface) -> None:
+        """Append a sub-interface and index it by VLAN ID."""
+        self.subinterfaces.append(sub)
+        self._subinterfaces_by_vlan[sub.vlan_id] = sub
+
+    def remove_subinterface(self, sub: SubInterface) -> None:
+        """Remove a sub-interface and drop it from the index."""
+        self.subinterfaces.remove(sub)
+        self._subinterfaces_by_vlan.pop(sub.vlan_id, None)
+
     @property
     def vpp_name(self) -> str:
         """VPP interface name is the user-defined name."""
@@ -208,6 +225,30 @@ class BGPConfig:
     announced_prefixes: list[str] = field(default_factory=list)  # Prefixes to originate
     peers: list[BGPPeer] = field(default_factory=list)  # Multiple peers
 
+    def __post_init__(self):
+        self._peers_by_ip = {p.peer_ip: p for p in self.peers}
+
+    # Mutate peers through these so the peer_ip index stays in sync with the list.
+
+    def get_peer(self, peer_ip: str) -> Optional[BGPPeer]:
+        """Look up a peer by its address."""
+        return self._peers_by_ip.get(peer_ip)
+
+    def add_peer(self, peer: BGPPeer) -> None:
+        """Append a peer and index it by address."""
+        self.peers.append(peer)
+        self._peers_by_ip[peer.peer_ip] = peer
+
+    def remove_peer(self, peer: BGPPeer) -> None:
+        """Remove a peer and drop it from the index."""
+        self.peers.remove(peer)
+        self._peers_by_ip.pop(peer.peer_ip, None)
+
+    def clear_peers(self) -> None:
+        """Remove all peers."""
+        self.peers = []
+        self._peers_by_ip = {}
+
 
 @dataclass
 class OSPFConfig:
@@ -394,3 +435,102 @@ class RouterConfig:
     loopbacks: list[LoopbackInterface] = field(default_factory=list)
     bvi_domains: list[BVIConfig] = field(default_factory=list)
     modules: list[dict] = field(default_factory=list)  # Module configs from router.json
+
+    def __post_init__(self):
+        self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuild lookup indexes after the indexed lists are replaced wholesale."""
+        self._interfaces_by_name = {iface.name: iface for iface in self.interfaces}
+        self._modules_by_name = {m.get('name'): m for m in self.modules}
+        self._loopbacks_by_instance = {lo.instance: lo for lo in self.loopbacks}
+        self._bvi_by_bridge_id = {bvi.bridge_id: bvi for bvi in self.bvi_domains}
+        self._vlan_passthrough_by_id = {}
+        for vlan in self.vlan_passthrough:
+            self._vlan_passthrough_by_id.setdefault(vlan.vlan_id, vlan)
+        # Lowest unused loopback instance / bridge ID (BVIs start at 100 to avoid loopback conflicts)
+        self._next_loop_instance = self._first_free(self._loopbacks_by_instance, 0)
+        self._next_bridge_id = self._first_free(self._bvi_by_bridge_id, 100)
+
+    @staticmethod
+    def _first_free(used: dict, start: int) -> int:
+        while start in used:
+            start += 1
+        return start
+
+    # Index-aware accessors: modules, loopbacks, bvi_domains and vlan_passthrough
+    # should be mutated through these so the lookup dicts stay in sync with the lists.
+
+    def get_interface(self, name: str) -> Optional[Interface]:
+        """Look up a dataplane interface by its user-defined name."""
+        return self._interfaces_by_name.get(name)
+
+    def get_module(self, name: str) -> Optional[dict]:
+        """Look up a module config dict by module name."""
+        return self._modules_by_name.get(name)
+
+    def add_module(self, module: dict) -> None:
+        """Append a module config dict and index it by name."""
+        self.modules.append(module)
+        self._modules_by_name[module.get('name')] = module
+
+    def get_loopback(self, instance: int) -> Optional[LoopbackInterface]:
+        """Look up a loopback by VPP instance number."""
+        return self._loopbacks_by_instance.get(instance)
+
+    def next_loopback_instance(self) -> int:
+        """Lowest loopback instance number not in use."""
+        return self._next_loop_instance
+
+    def add_loopback(self, loopback: LoopbackInterface) -> None:
+        """Append a loopback and index it by instance."""
+        self.loopbacks.append(loopback)
+        self._loopbacks_by_instance[loopback.instance] = loopback
+        if loopback.instance == self._next_loop_instance:
+            self._next_loop_instance = self._first_free(self._loopbacks_by_instance, loopback.instance)
+
+    def remove_loopback(self, loopback: LoopbackInterface) -> None:
+        """Remove a loopback and drop it from the index."""
+        self.loopbacks.remove(loopback)
+        self._loopbacks_by_instance.pop(loopback.instance, None)
+        self._next_loop_instance = min(self._next_loop_instance, loopback.instance)
+
+    def get_bvi(self, bridge_id: int) -> Optional[BVIConfig]:
+        """Look up a BVI domain by bridge ID."""
+        return self._bvi_by_bridge_id.get(bridge_id)
+
+    def next_bridge_id(self) -> int:
+        """Lowest BVI bridge ID (100 and up) not in use."""
+        return self._next_bridge_id
+
+    def add_bvi(self, bvi: BVIConfig) -> None:
+        """Append a BVI domain and index it by bridge ID."""
+        self.bvi_domains.append(bvi)
+        self._bvi_by_bridge_id[bvi.bridge_id] = bvi
+        if bvi.bridge_id == self._next_bridge_id:
+            self._next_bridge_id = self._first_free(self._bvi_by_bridge_id, bvi.bridge_id)
+
+    def remove_bvi(self, bvi: BVIConfig) -> None:
+        """Remove a BVI domain and drop it from the index."""
+        self.bvi_domains.remove(bvi)
+        self._bvi_by_bridge_id.pop(bvi.bridge_id, None)
+        if bvi.bridge_id >= 100:
+            self._next_bridge_id = min(self._next_bridge_id, bvi.bridge_id)
+
+    def get_vlan_passthrough(self, vlan_id: int) -> Optional[VLANPassthrough]:
+        """Look up the first VLAN passthrough with the given outer VLAN ID."""
+        return self._vlan_passthrough_by_id.get(vlan_id)
+
+    def add_vlan_passthrough(self, vlan: VLANPassthrough) -> None:
+        """Append a VLAN passthrough and index it by outer VLAN ID."""
+        self.vlan_passthrough.append(vlan)
+        self._vlan_passthrough_by_id.setdefault(vlan.vlan_id, vlan)
+
+    def remove_vlan_passthrough(self, vlan: VLANPassthrough) -> None:
+        """Remove a VLAN passthrough, re-pointing the index at any remaining QinQ sibling."""
+        self.vlan_passthrough.remove(vlan)
+        if self._vlan_passthrough_by_id.get(vlan.vlan_id) is vlan:
+            del self._vlan_passthrough_by_id[vlan.vlan_id]
+            sibling = next((v for v in self.vlan_passthrough if v.vlan_id == vlan.vlan_id), None)
+            if sibling:
+                self._vlan_passthrough_by_id[vlan.vlan_id] = sibling
@@ -5,6 +5,7 @@ IP address and CIDR validation utilities.
 """
 
 import ipaddress
+from functools import lru_cache
 
 
 def validate_ipv4(ip: str) -> bool:
@@ -16,6 +17,7 @@ def validate_ipv4(ip: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=256)
 def validate_ipv4_cidr(cidr: str) -> bool:
     """Validate an IPv4 CIDR notation."""
     try:
@@ -34,6 +36,7 @@ def validate_ipv6(ip: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=256)
 def validate_ipv6_cidr(cidr: str) -> bool:
     """Validate an IPv6 CIDR notation."""
     try:
@@ -40,6 +40,7 @@ from .loader import (
     load_module_definition,
     ensure_modules_dir,
     list_available_modules,
+    list_installed_module_names,
     list_example_modules,
     install_module_from_example,
     allocate_memif_addresses,
@@ -77,6 +78,7 @@ __all__ = [
     'load_module_definition',
     'ensure_modules_dir',
     'list_available_modules',
+    'list_installed_module_names',
     'list_example_modules',
     'install_module_from_example',
     'allocate_memif_addresses',
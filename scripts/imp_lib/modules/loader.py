@@ -4,11 +4,18 @@ Module loader for IMP.
 Functions for loading module definitions from YAML files.
 """
 
+import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Tuple
 
 try:
     import yaml
+    # Prefer the libyaml-backed loader; fall back to the pure-Python one
+    try:
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:
+        from yaml import SafeLoader as _SafeLoader
 except ImportError:
     yaml = None
 
@@ -35,6 +42,70 @@ from .validation import (
 )
 
 
+# =============================================================================
+# Listing Cache
+# =============================================================================
+
+# Module listings are requested by the REPL (and its completer) far more often
+# than the YAML on disk changes. Cache parsed files and directory listings,
+# validated by (st_mtime_ns, st_size) so edits and installs are picked up.
+_CACHE_MAX_ENTRIES = 100
+_yaml_cache: "OrderedDict[str, tuple[int, int, object]]" = OrderedDict()
+_dir_cache: "OrderedDict[str, tuple[int, int, list[Path]]]" = OrderedDict()
+_def_cache: "OrderedDict[str, tuple[int, int, ModuleDefinition]]" = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, key: str, st: os.stat_result):
+    """Return the cached value for key if its stat signature still matches, else None."""
+    hit = cache.get(key)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        cache.move_to_end(key)
+        return hit[2]
+    return None
+
+
+def _cache_put(cache: OrderedDict, key: str, st: os.stat_result, value) -> None:
+    """Store value under key with its stat signature, evicting the oldest entries."""
+    cache[key] = (st.st_mtime_ns, st.st_size, value)
+    cache.move_to_end(key)
+    while len(cache) > _CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+def _list_yaml_files(directory: Path) -> list[Path]:
+    """List *.yaml files in directory (sorted), reusing the last scan if the directory is unchanged."""
+    try:
+        st = os.stat(directory)
+    except FileNotFoundError:
+        return []
+    key = str(directory)
+    paths = _cache_get(_dir_cache, key, st)
+    if paths is None:
+        # Check the name before is_file(), which may need a stat when d_type is unknown
+        with os.scandir(directory) as entries:
+            paths = sorted(
+                directory / e.name for e in entries
+                if e.name.endswith(".yaml") and e.is_file()
+            )
+        _cache_put(_dir_cache, key, st, paths)
+    return paths
+
+
+def _load_yaml_cached(yaml_path: Path):
+    """Parse a YAML file, skipping the parse if the file is unchanged since last time.
+
+    The cached object is shared between callers and must be treated as read-only.
+    """
+    st = os.stat(yaml_path)
+    key = str(yaml_path)
+    data = _cache_get(_yaml_cache, key, st)
+    if data is None:
+        with open(yaml_path) as f:
+            data = yaml.load(f, Loader=_SafeLoader)
+        _cache_put(_yaml_cache, key, st, data)
+    return data
+
+
 def parse_module_definition(data: dict) -> ModuleDefinition:
     """Parse a module definition from YAML data dict."""
     # Parse connections
@@ -152,7 +223,7 @@ def load_module_definition(name: str, definitions_dir: Path = MODULE_DEFINITIONS
         definitions_dir: Directory containing module YAML files
 
     Returns:
-        Parsed ModuleDefinition
+        Parsed ModuleDefinition (cached until the file changes; treat as read-only)
 
     Raises:
         FileNotFoundError: If module YAML doesn't exist
@@ -162,12 +233,18 @@ def load_module_definition(name: str, definitions_dir: Path = MODULE_DEFINITIONS
         raise ImportError("PyYAML is required. Install with: apt install python3-yaml")
 
     yaml_path = definitions_dir / f"{name}.yaml"
-    if not yaml_path.exists():
-        raise FileNotFoundError(f"Module definition not found: {yaml_path}")
+    try:
+        st = os.stat(yaml_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Module definition not found: {yaml_path}") from None
+    key = str(yaml_path)
+    module_def = _cache_get(_def_cache, key, st)
+    if module_def is not None:
+        return module_def
 
     with open(yaml_path) as f:
         try:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             raise ModuleValidationError(f"YAML syntax error in {yaml_path}: {e}")
 
@@ -179,7 +256,9 @@ def load_module_definition(name: str, definitions_dir: Path = MODULE_DEFINITIONS
     if errors:
         raise ModuleValidationError(f"Module '{name}' validation failed:\n  " + "\n  ".join(errors))
 
-    return parse_module_definition(data)
+    module_def = parse_module_definition(data)
+    _cache_put(_def_cache, key, st, module_def)
+    return module_def
 
 
 def ensure_modules_dir(definitions_dir: Path = MODULE_DEFINITIONS_DIR) -> None:
@@ -197,14 +276,10 @@ def list_available_modules(definitions_dir: Path = MODULE_DEFINITIONS_DIR) -> Li
     if yaml is None:
         return []
 
-    if not definitions_dir.exists():
-        return []
-
     modules = []
-    for yaml_path in sorted(definitions_dir.glob("*.yaml")):
+    for yaml_path in _list_yaml_files(definitions_dir):
         try:
-            with open(yaml_path) as f:
-                data = yaml.safe_load(f)
+            data = _load_yaml_cached(yaml_path)
             if isinstance(data, dict):
                 name = data.get('name', yaml_path.stem)
                 display_name = data.get('display_name', name)
@@ -217,6 +292,15 @@ def list_available_modules(definitions_dir: Path = MODULE_DEFINITIONS_DIR) -> Li
     return modules
 
 
+def list_installed_module_names(definitions_dir: Path = MODULE_DEFINITIONS_DIR) -> set[str]:
+    """
+    Names of installed module definitions, taken from the YAML file names.
+
+    Uses the cached directory scan, so repeated calls cost a single stat.
+    """
+    return {p.stem for p in _list_yaml_files(definitions_dir)}
+
+
 def list_example_modules(examples_dir: Path = MODULE_EXAMPLES_DIR) -> List[Tuple[str, str, str]]:
     """
     List available module examples (shipped with image).
@@ -260,6 +344,7 @@ def install_module_from_example(
 
     # Copy the file
     shutil.copy2(src, dst)
+    _dir_cache.pop(str(definitions_dir), None)
 
 
 # =============================================================================
@@ -12,13 +12,14 @@ This package contains the modular components for the IMP interactive REPL:
 """
 
 from .context import MenuContext, get_prompt_text
-from .menu import build_menu_tree
+from .menu import MENU_TREE, build_menu_tree
 from .navigation import navigate
 from .completer import MenuCompleter
 
 __all__ = [
     'MenuContext',
     'get_prompt_text',
+    'MENU_TREE',
     'build_menu_tree',
     'navigate',
     'MenuCompleter',
@@ -6,29 +6,33 @@ This module provides commands for VPP packet capture (pcap trace).
 
 import os
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from imp_lib.common import Colors, log, warn, error
 from imp_lib.common.vpp import vpp_exec
 
-# VPP socket paths
-VPP_CORE_SOCKET = "/run/vpp/core-cli.sock"
-VPP_NAT_SOCKET = "/run/vpp/nat-cli.sock"
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
 
 
 def _format_size(size_bytes: int) -> str:
     """Format bytes as human-readable size."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
+    for unit in _SIZE_UNITS:
         if size_bytes < 1024:
             return f"{size_bytes:.1f} {unit}"
         size_bytes /= 1024
     return f"{size_bytes:.1f} TB"
 
 
-def _format_age(mtime: float) -> str:
-    """Format file modification time as relative age."""
-    import time
-    age_secs = time.time() - mtime
+def _format_age(mtime: float, now: float = None) -> str:
+    """Format file modification time as relative age.
+
+    Pass ``now`` when formatting a whole listing so the clock is read once.
+    """
+    if now is None:
+        now = time.time()
+    age_secs = now - mtime
     if age_secs < 60:
         return "just now"
     if age_secs < 3600:
@@ -44,7 +48,6 @@ def _format_age(mtime: float) -> str:
 def _get_pcap_files() -> list[dict]:
     """Get list of pcap files in /tmp, sorted by modification time (newest first)."""
     import glob
-    from datetime import datetime
 
     pcap_files = glob.glob("/tmp/*.pcap")
     files = []
@@ -64,6 +67,18 @@ def _get_pcap_files() -> list[dict]:
     return files
 
 
+def _resolve_pcap_arg(name: str) -> str:
+    """Resolve a capture name to a path under /tmp. Returns filepath or empty string."""
+    if not name.startswith("/"):
+        name = f"/tmp/{name}"
+    if not name.endswith(".pcap"):
+        name += ".pcap"
+    if os.path.isfile(name):
+        return name
+    error(f"File not found: {name}")
+    return ""
+
+
 def _pick_pcap_file(prompt: str = "Select file") -> str:
     """Show numbered list of pcap files and let user pick one. Returns filepath or empty string."""
     files = _get_pcap_files()
@@ -74,10 +89,10 @@ def _pick_pcap_file(prompt: str = "Select file") -> str:
 
     print()
     print(f"  {Colors.BOLD}Available captures:{Colors.NC}")
-    from datetime import datetime
+    now = time.time()
     for i, f in enumerate(files, 1):
         size_str = _format_size(f["size"])
-        age = _format_age(f["mtime"])
+        age = _format_age(f["mtime"], now)
         print(f"    {i}. {f['name']} ({size_str}, {age})")
 
     print()
@@ -93,20 +108,11 @@ def _pick_pcap_file(prompt: str = "Select file") -> str:
             return ""
     except ValueError:
         # Treat as filename
-        if not choice.startswith("/"):
-            choice = f"/tmp/{choice}"
-        if not choice.endswith(".pcap"):
-            choice += ".pcap"
-        if Path(choice).exists():
-            return choice
-        error(f"File not found: {choice}")
-        return ""
+        return _resolve_pcap_arg(choice)
 
 
 def cmd_capture_start(ctx, args: list[str]) -> None:
     """Start a packet capture on a VPP instance."""
-    import time
-
     print()
     print(f"{Colors.BOLD}Start Packet Capture{Colors.NC}")
     print()
@@ -121,7 +127,7 @@ def cmd_capture_start(ctx, args: list[str]) -> None:
     success, iface_output = vpp_exec("show interface", instance)
     if success and iface_output:
         print(f"\n  Available interfaces:")
-        for line in iface_output.split('\n'):
+        for line in iface_output.splitlines():
             line = line.strip()
             if line and not line.startswith(' ') and not line.startswith('Name'):
                 parts = line.split()
@@ -202,14 +208,17 @@ def cmd_capture_status(ctx, args: list[str]) -> None:
     print(f"{Colors.BOLD}Capture Status{Colors.NC}")
     print("=" * 50)
 
-    for instance in ("core", "nat"):
-        socket = VPP_CORE_SOCKET if instance == "core" else VPP_NAT_SOCKET
-        if not Path(socket).exists():
-            print(f"  {instance}: {Colors.DIM}VPP not running{Colors.NC}")
-            continue
+    # Query both instances concurrently; each call is a vppctl round-trip.
+    # vpp_exec checks the CLI socket itself, so a stopped instance returns fast.
+    instances = ("core", "nat")
+    with ThreadPoolExecutor(max_workers=len(instances)) as pool:
+        futures = {inst: pool.submit(vpp_exec, "pcap trace status", inst) for inst in instances}
 
-        success, output = vpp_exec("pcap trace status", instance)
-        if success:
+    for instance in instances:
+        success, output = futures[instance].result()
+        if not success and "socket not found" in output:
+            print(f"  {instance}: {Colors.DIM}VPP not running{Colors.NC}")
+        elif success:
             if not output.strip() or "No pcap" in output or "disabled" in output.lower():
                 print(f"  {instance}: No active capture")
             else:
@@ -223,7 +232,7 @@ def cmd_capture_status(ctx, args: list[str]) -> None:
                         print(f"  {instance}: {Colors.CYAN}ACTIVE{Colors.NC} - {captured}/{limit} packets")
                 else:
                     print(f"  {instance}:")
-                    for line in output.split('\n'):
+                    for line in output.splitlines():
                         if line.strip():
                             print(f"    {line}")
         else:
@@ -233,36 +242,18 @@ def cmd_capture_status(ctx, args: list[str]) -> None:
 
 def cmd_capture_files(ctx, args: list[str]) -> None:
     """List pcap files in /tmp."""
-    import glob
     from datetime import datetime
 
     print()
     print(f"{Colors.BOLD}Capture Files{Colors.NC}")
     print("=" * 70)
 
-    pcap_files = glob.glob("/tmp/*.pcap")
-    if not pcap_files:
+    files = _get_pcap_files()
+    if not files:
         print("  No pcap files found in /tmp")
         print()
         return
 
-    # Get file info
-    files = []
-    for f in pcap_files:
-        try:
-            stat = os.stat(f)
-            files.append({
-                "path": f,
-                "name": os.path.basename(f),
-                "size": stat.st_size,
-                "mtime": stat.st_mtime
-            })
-        except OSError:
-            continue
-
-    # Sort by modification time, newest first
-    files.sort(key=lambda x: x["mtime"], reverse=True)
-
     print(f"  {'FILENAME':<40} {'SIZE':>10} {'MODIFIED':<20}")
     print("  " + "-" * 68)
 
@@ -277,19 +268,11 @@ def cmd_capture_files(ctx, args: list[str]) -> None:
 def cmd_capture_analyze(ctx, args: list[str]) -> None:
     """Analyze a pcap file using tshark."""
     if args:
-        filename = args[0]
-        # Resolve path
-        if not filename.startswith("/"):
-            filename = f"/tmp/{filename}"
-        if not filename.endswith(".pcap"):
-            filename += ".pcap"
-        if not Path(filename).exists():
-            error(f"File not found: {filename}")
-            return
+        filename = _resolve_pcap_arg(args[0])
     else:
         filename = _pick_pcap_file("Analyze file")
-        if not filename:
-            return
+    if not filename:
+        return
 
     print()
     print(f"{Colors.BOLD}Capture Analysis: {os.path.basename(filename)}{Colors.NC}")
@@ -302,7 +285,7 @@ def cmd_capture_analyze(ctx, args: list[str]) -> None:
         capture_output=True, text=True
     )
     if result.returncode == 0:
-        for line in result.stdout.strip().split('\n'):
+        for line in result.stdout.strip().splitlines():
             if line.strip():
                 print(f"  {line}")
     else:
@@ -315,7 +298,7 @@ def cmd_capture_analyze(ctx, args: list[str]) -> None:
         capture_output=True, text=True
     )
     if result.returncode == 0:
-        for line in result.stdout.strip().split('\n'):
+        for line in result.stdout.strip().splitlines():
             print(f"  {line}")
     else:
         warn("tshark not available - install tshark package")
@@ -327,7 +310,7 @@ def cmd_capture_analyze(ctx, args: list[str]) -> None:
         capture_output=True, text=True
     )
     if result.returncode == 0:
-        lines = result.stdout.strip().split('\n')
+        lines = result.stdout.strip().splitlines()
         # Limit to top entries
         for line in lines[:15]:
             print(f"  {line}")
@@ -342,43 +325,33 @@ def cmd_capture_export(ctx, args: list[str]) -> None:
     import shutil
 
     if args:
-        src = args[0]
-        if not src.startswith("/"):
-            src = f"/tmp/{src}"
-        if not src.endswith(".pcap"):
-            src += ".pcap"
-        if not Path(src).exists():
-            error(f"File not found: {src}")
-            return
+        src = _resolve_pcap_arg(args[0])
     else:
         src = _pick_pcap_file("Export file")
-        if not src:
-            return
+    if not src:
+        return
 
     # Destination
     dest_dir = Path("/persistent/data/captures")
     dest_dir.mkdir(parents=True, exist_ok=True)
     dest = dest_dir / os.path.basename(src)
 
-    shutil.copy2(src, dest)
+    # Same data copy as copy2, but carry over only the timestamps rather than
+    # copy2's full copystat() (mode bits and xattrs are not copied)
+    st = os.stat(src)
+    shutil.copyfile(src, dest)
+    os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
     log(f"Exported to: {dest}")
 
 
 def cmd_capture_delete(ctx, args: list[str]) -> None:
     """Delete a pcap file."""
     if args:
-        filepath = args[0]
-        if not filepath.startswith("/"):
-            filepath = f"/tmp/{filepath}"
-        if not filepath.endswith(".pcap"):
-            filepath += ".pcap"
-        if not Path(filepath).exists():
-            error(f"File not found: {filepath}")
-            return
+        filepath = _resolve_pcap_arg(args[0])
     else:
         filepath = _pick_pcap_file("Delete file")
-        if not filepath:
-            return
+    if not filepath:
+        return
 
     confirm = input(f"  Delete {os.path.basename(filepath)}? [y/N]: ").strip().lower()
     if confirm == 'y':
@@ -21,12 +21,9 @@ from imp_lib.config import (
 
 def find_module(config, name: str):
     """Find module dict by name in config.modules list."""
-    if not config or not hasattr(config, 'modules') or not config.modules:
+    if not config:
         return None
-    for module in config.modules:
-        if module.get('name') == name:
-            return module
-    return None
+    return config.get_module(name)
 
 
 def prompt_value(prompt: str, validator=None, required: bool = True, default: str = None) -> Optional[str]:
@@ -81,10 +78,7 @@ def cmd_loopback_add(ctx, args: list[str]) -> None:
     print()
 
     # Find next available instance
-    used_instances = {lo.instance for lo in ctx.config.loopbacks}
-    instance = 0
-    while instance in used_instances:
-        instance += 1
+    instance = ctx.config.next_loopback_instance()
 
     # Get name
     name = prompt_value(f"Name for loop{instance} (e.g., 'router-id', 'services')")
@@ -111,7 +105,7 @@ def cmd_loopback_add(ctx, args: list[str]) -> None:
     create_lcp = prompt_yes_no("Create linux_cp TAP for FRR visibility?", default=True)
 
     # Add to config
-    ctx.config.loopbacks.append(LoopbackInterface(
+    ctx.config.add_loopback(LoopbackInterface(
         instance=instance,
         name=name,
         ipv4=ipv4,
@@ -156,18 +150,46 @@ def cmd_loopback_delete(ctx, args: list[str]) -> None:
             error(f"Invalid loopback: {arg} (use 'loop0' or '0')")
             return
 
-    lo = next((l for l in ctx.config.loopbacks if l.instance == instance), None)
+    lo = ctx.config.get_loopback(instance)
     if not lo:
         available = ", ".join(f"loop{lo.instance}" for lo in ctx.config.loopbacks)
         error(f"Loopback loop{instance} not found (available: {available})")
         return
 
     if prompt_yes_no(f"Delete loop{instance} ({lo.name})?"):
-        ctx.config.loopbacks.remove(lo)
+        ctx.config.remove_loopback(lo)
         ctx.dirty = True
         log(f"Deleted loopback: loop{instance}")
 
 
+def _edit_cidr(obj, field_ip: str, field_prefix: str, validator, label: str) -> bool:
+    """Prompt to replace or clear an address/prefix pair on obj. Returns True if changed."""
+    ip = getattr(obj, field_ip)
+    prefix = getattr(obj, field_prefix)
+    current_display = f"{ip}/{prefix}" if ip else ""
+    new_value = input(f"{label} CIDR [{current_display}]: ").strip()
+    if not new_value:
+        return False
+
+    if new_value.lower() == "none" or new_value == "-":
+        if ip:
+            setattr(obj, field_ip, None)
+            setattr(obj, field_prefix, None)
+            return True
+        return False
+
+    if not validator(new_value):
+        warn(f"Invalid {label} CIDR: {new_value}, keeping current value")
+        return False
+
+    new_ip, new_prefix = parse_cidr(new_value)
+    if new_ip != ip or new_prefix != prefix:
+        setattr(obj, field_ip, new_ip)
+        setattr(obj, field_prefix, new_prefix)
+        return True
+    return False
+
+
 def cmd_loopback_edit(ctx, args: list[str]) -> None:
     """Edit an existing loopback interface."""
     if not ctx.config:
@@ -199,7 +221,7 @@ def cmd_loopback_edit(ctx, args: list[str]) -> None:
             error(f"Invalid loopback: {arg} (use 'loop0' or '0')")
             return
 
-    lo = next((l for l in ctx.config.loopbacks if l.instance == instance), None)
+    lo = ctx.config.get_loopback(instance)
     if not lo:
         available = ", ".join(f"loop{lo.instance}" for lo in ctx.config.loopbacks)
         error(f"Loopback loop{instance} not found (available: {available})")
@@ -225,41 +247,11 @@ def cmd_loopback_edit(ctx, args: list[str]) -> None:
         lo.name = new_name
         changed = True
 
-    # Edit IPv4
-    current_ipv4_display = f"{lo.ipv4}/{lo.ipv4_prefix}" if lo.ipv4 else ""
-    new_ipv4 = input(f"IPv4 CIDR [{current_ipv4_display}]: ").strip()
-    if new_ipv4:
-        if new_ipv4.lower() == "none" or new_ipv4 == "-":
-            if lo.ipv4:
-                lo.ipv4 = None
-                lo.ipv4_prefix = None
-                changed = True
-        elif validate_ipv4_cidr(new_ipv4):
-            new_ip, new_prefix = parse_cidr(new_ipv4)
-            if new_ip != lo.ipv4 or new_prefix != lo.ipv4_prefix:
-                lo.ipv4 = new_ip
-                lo.ipv4_prefix = new_prefix
-                changed = True
-        else:
-            warn(f"Invalid IPv4 CIDR: {new_ipv4}, keeping current value")
-
-    # Edit IPv6
-    current_ipv6_display = f"{lo.ipv6}/{lo.ipv6_prefix}" if lo.ipv6 else ""
-    new_ipv6 = input(f"IPv6 CIDR [{current_ipv6_display}]: ").strip()
-    if new_ipv6:
-        if new_ipv6.lower() == "none" or new_ipv6 == "-":
-            if lo.ipv6:
-                lo.ipv6 = None
-                lo.ipv6_prefix = None
-                changed = True
-        elif validate_ipv6_cidr(new_ipv6):
-            new_ip, new_prefix = parse_cidr(new_ipv6)
-            if new_ip != lo.ipv6 or new_prefix != lo.ipv6_prefix:
-                lo.ipv6 = new_ip
-                lo.ipv6_prefix = new_prefix
-                changed = True
-        else:
-            warn(f"Invalid IPv6 CIDR: {new_ipv6}, keeping current value")
+    # Edit addresses
+    if _edit_cidr(lo, "ipv4", "ipv4_prefix", validate_ipv4_cidr, "IPv4"):
+        changed = True
+    if _edit_cidr(lo, "ipv6", "ipv6_prefix", validate_ipv6_cidr, "IPv6"):
+        changed = True
 
     if changed:
         ctx.dirty = True
@@ -283,10 +275,7 @@ def cmd_bvi_add(ctx, args: list[str]) -> None:
     print()
 
     # Find next available bridge ID (start at 100 to avoid loopback conflicts)
-    used_ids = {bvi.bridge_id for bvi in ctx.config.bvi_domains}
-    bridge_id = 100
-    while bridge_id in used_ids:
-        bridge_id += 1
+    bridge_id = ctx.config.next_bridge_id()
 
     # Get name
     name = prompt_value(f"Name for BVI {bridge_id} (e.g., 'customer-vlan', 'mgmt-bridge')")
@@ -345,7 +334,7 @@ def cmd_bvi_add(ctx, args: list[str]) -> None:
     create_lcp = prompt_yes_no("Create linux_cp TAP for FRR visibility?", default=True)
 
     # Add to config
-    ctx.config.bvi_domains.append(BVIConfig(
+    ctx.config.add_bvi(BVIConfig(
         bridge_id=bridge_id,
         name=name,
         members=members,
@@ -391,14 +380,14 @@ def cmd_bvi_delete(ctx, args: list[str]) -> None:
             error(f"Invalid BVI: {arg} (use 'bvi100' or '100')")
             return
 
-    bvi = next((b for b in ctx.config.bvi_domains if b.bridge_id == bridge_id), None)
+    bvi = ctx.config.get_bvi(bridge_id)
     if not bvi:
         available = ", ".join(f"bvi{b.bridge_id}" for b in ctx.config.bvi_domains)
         error(f"BVI bvi{bridge_id} not found (available: {available})")
         return
 
     if prompt_yes_no(f"Delete bvi{bridge_id} ({bvi.name})?"):
-        ctx.config.bvi_domains.remove(bvi)
+        ctx.config.remove_bvi(bvi)
         ctx.dirty = True
         log(f"Deleted BVI domain: bvi{bridge_id}")
 
@@ -473,7 +462,7 @@ def cmd_vlan_passthrough_add(ctx, args: list[str]) -> None:
         return
 
     # Add to config
-    ctx.config.vlan_passthrough.append(VLANPassthrough(
+    ctx.config.add_vlan_passthrough(VLANPassthrough(
         vlan_id=vlan_id,
         vlan_type=vlan_type,
         inner_vlan=inner_vlan,
@@ -504,13 +493,13 @@ def cmd_vlan_passthrough_delete(ctx, args: list[str]) -> None:
         error("VLAN ID must be a number")
         return
 
-    vlan = next((v for v in ctx.config.vlan_passthrough if v.vlan_id == vlan_id), None)
+    vlan = ctx.config.get_vlan_passthrough(vlan_id)
     if not vlan:
         error(f"VLAN passthrough {vlan_id} not found")
         return
 
     if prompt_yes_no(f"Delete VLAN passthrough {vlan_id}?"):
-        ctx.config.vlan_passthrough.remove(vlan)
+        ctx.config.remove_vlan_passthrough(vlan)
         ctx.dirty = True
         log(f"Deleted VLAN passthrough: {vlan_id}")
 
@@ -521,18 +510,15 @@ def cmd_vlan_passthrough_delete(ctx, args: list[str]) -> None:
 
 def _get_parent_interface(ctx):
     """Get the parent interface for sub-interface operations based on current path."""
-    # Strip config prefix for path matching
-    path = ctx.path[1:] if ctx.path and ctx.path[0] == "config" else ctx.path
-
-    if path[:2] == ["interfaces", "external"] and "subinterfaces" in path:
-        return ctx.config.external, "external"
+    # Skip the config prefix by offset rather than slicing a copy of the path
+    path = ctx.path
+    base = 1 if path and path[0] == "config" else 0
 
-    if len(path) >= 3 and path[0] == "interfaces" and path[1] == "internal":
-        iface_name = path[2]
-        for iface in ctx.config.internal:
-            if iface.vpp_name == iface_name:
-                if len(path) >= 4 and path[3] == "subinterfaces":
-                    return iface, iface.vpp_name
+    # Path like ["interfaces", "lan", "subinterfaces"]
+    if len(path) >= base + 3 and path[base] == "interfaces" and path[base + 2] == "subinterfaces":
+        iface = ctx.config.get_interface(path[base + 1])
+        if iface:
+            return iface, iface.vpp_name
 
     return None, None
 
@@ -565,7 +551,7 @@ def cmd_subinterface_add(ctx, args: list[str]) -> None:
         return
 
     # Check for duplicate
-    if any(s.vlan_id == vlan_id for s in parent.subinterfaces):
+    if parent.get_subinterface(vlan_id):
         error(f"Sub-interface .{vlan_id} already exists on {parent_name}")
         return
 
@@ -589,7 +575,7 @@ def cmd_subinterface_add(ctx, args: list[str]) -> None:
     create_lcp = prompt_yes_no("Create linux_cp TAP for FRR visibility?", default=True)
 
     # Add to parent
-    parent.subinterfaces.append(SubInterface(
+    parent.add_subinterface(SubInterface(
         vlan_id=vlan_id,
         ipv4=ipv4,
         ipv4_prefix=ipv4_prefix,
@@ -623,12 +609,12 @@ def cmd_subinterface_delete(ctx, args: list[str]) -> None:
         error("VLAN ID must be a number")
         return
 
-    sub = next((s for s in parent.subinterfaces if s.vlan_id == vlan_id), None)
+    sub = parent.get_subinterface(vlan_id)
     if not sub:
         error(f"Sub-interface .{vlan_id} not found on {parent_name}")
         return
 
     if prompt_yes_no(f"Delete {parent_name}.{vlan_id}?"):
-        parent.subinterfaces.remove(sub)
+        parent.remove_subinterface(sub)
         ctx.dirty = True
         log(f"Deleted sub-interface: {parent_name}.{vlan_id}")
@@ -12,6 +12,7 @@ from imp_lib.common import log, warn, error, info
 # Import module system
 from imp_lib.modules import (
     list_available_modules,
+    list_installed_module_names,
     list_example_modules,
     install_module_from_example,
     MODULE_DEFINITIONS_DIR,
@@ -58,7 +59,7 @@ def cmd_modules_list(ctx, args: list[str]) -> None:
 
     # Check which are enabled in config
     enabled_modules = set()
-    if ctx.config and hasattr(ctx.config, 'modules'):
+    if ctx.config:
         for m in ctx.config.modules:
             if m.get('enabled'):
                 enabled_modules.add(m.get('name'))
@@ -106,8 +107,7 @@ def cmd_modules_enable(ctx, args: list[str]) -> None:
     name = args[0]
 
     # Check if module definition exists
-    module_yaml = MODULE_DEFINITIONS_DIR / f"{name}.yaml"
-    if not module_yaml.exists():
+    if name not in list_installed_module_names():
         error(f"Module '{name}' not installed")
         info(f"Install with: config modules install {name}")
         return
@@ -124,7 +124,7 @@ def cmd_modules_enable(ctx, args: list[str]) -> None:
             return
 
     # Add new module entry
-    ctx.config.modules.append({
+    ctx.config.add_module({
         'name': name,
         'enabled': True,
         'config': {}
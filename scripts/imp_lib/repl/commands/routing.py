@@ -66,7 +66,7 @@ def cmd_bgp_disable(ctx, args: list[str]) -> None:
 
     if prompt_yes_no("Disable BGP? This will remove the BGP configuration"):
         ctx.config.bgp.enabled = False
-        ctx.config.bgp.peers = []  # Clear peers when disabling
+        ctx.config.bgp.clear_peers()  # Clear peers when disabling
         ctx.dirty = True
         log("BGP disabled")
 
@@ -122,10 +122,9 @@ def cmd_bgp_peers_add(ctx, args: list[str]) -> None:
         return
 
     # Check for duplicate
-    for p in ctx.config.bgp.peers:
-        if p.peer_ip == peer_ip:
-            error(f"Peer {peer_ip} already exists")
-            return
+    if ctx.config.bgp.get_peer(peer_ip):
+        error(f"Peer {peer_ip} already exists")
+        return
 
     # Peer ASN
     peer_asn_str = prompt_value("Peer AS number")
@@ -147,7 +146,7 @@ def cmd_bgp_peers_add(ctx, args: list[str]) -> None:
         peer_asn=peer_asn,
         description=description
     )
-    ctx.config.bgp.peers.append(peer)
+    ctx.config.bgp.add_peer(peer)
     ctx.dirty = True
 
     af = "IPv6" if ':' in peer_ip else "IPv4"
@@ -182,15 +181,15 @@ def cmd_bgp_peers_remove(ctx, args: list[str]) -> None:
             return
 
     # Find and remove peer
-    for p in ctx.config.bgp.peers:
-        if p.peer_ip == peer_ip:
-            if prompt_yes_no(f"Remove peer {p.name} ({peer_ip})?"):
-                ctx.config.bgp.peers.remove(p)
-                ctx.dirty = True
-                log(f"Removed BGP peer {peer_ip}")
-            return
+    p = ctx.config.bgp.get_peer(peer_ip)
+    if not p:
+        error(f"Peer {peer_ip} not found")
+        return
 
-    error(f"Peer {peer_ip} not found")
+    if prompt_yes_no(f"Remove peer {p.name} ({peer_ip})?"):
+        ctx.config.bgp.remove_peer(p)
+        ctx.dirty = True
+        log(f"Removed BGP peer {peer_ip}")
 
 
 # =============================================================================
@@ -4,43 +4,80 @@ Shell commands for REPL.
 This module provides commands to access VPP and FRR shells directly.
 """
 
-import subprocess
-from pathlib import Path
+import os
+import signal
+from typing import Optional
 
 from imp_lib.common import log, warn, error
 from imp_lib.common.vpp import get_vpp_socket, get_available_vpp_instances
 
 
-def list_running_modules() -> list[str]:
+def list_running_modules(tick: Optional[int] = None) -> list[str]:
     """
     Discover running VPP module sockets (excludes core).
 
+    Args:
+        tick: Optional REPL prompt tick to reuse that prompt's socket scan
+
     Returns:
         List of module names (e.g., ['nat', 'nat64'])
     """
-    return [name for name in get_available_vpp_instances() if name != "core"]
+    return [name for name in get_available_vpp_instances(tick) if name != "core"]
+
+
+def _exists(path: str) -> bool:
+    """Single stat() probe used to give a friendly error before spawning a shell."""
+    try:
+        os.stat(path)
+    except OSError:
+        return False
+    return True
+
+
+def _run_interactive(argv: list[str]) -> None:
+    """Run an interactive program on the terminal and wait for it to exit."""
+    # Spawned directly rather than via subprocess.run, which kills the child when
+    # Ctrl-C reaches the REPL. Python ignores SIGPIPE/SIGXFSZ; reset them for the
+    # child as subprocess's restore_signals does.
+    try:
+        pid = os.posix_spawnp(
+            argv[0], argv, os.environ,
+            setsigdef=(signal.SIGPIPE, signal.SIGXFSZ),
+        )
+    except FileNotFoundError:
+        error(f"{argv[0]} not found")
+        return
+    except OSError as e:
+        error(f"Failed to start {argv[0]}: {e}")
+        return
+    while True:
+        try:
+            os.waitpid(pid, 0)
+            return
+        except KeyboardInterrupt:
+            # Ctrl-C belongs to the child shell; keep waiting for it
+            continue
 
 
 def cmd_shell_routing(ctx, args: list[str]) -> None:
     """Open FRR vtysh shell."""
-    ns_path = Path(f"/var/run/netns/dataplane")
-    if not ns_path.exists():
+    if not _exists("/var/run/netns/dataplane"):
         error("Dataplane namespace not found")
         return
     log("Entering FRR routing shell (vtysh)...")
     print("Type 'exit' to return\n")
-    subprocess.run(["ip", "netns", "exec", "dataplane", "vtysh"], check=False)
+    _run_interactive(["ip", "netns", "exec", "dataplane", "vtysh"])
 
 
 def cmd_shell_core(ctx, args: list[str]) -> None:
     """Open VPP core CLI."""
-    socket = "/run/vpp/core-cli.sock"
-    if not Path(socket).exists():
+    socket = get_vpp_socket("core")
+    if not _exists(socket):
         error("VPP core socket not found")
         return
     log("Entering VPP core CLI...")
     print("Type 'quit' to return\n")
-    subprocess.run(["vppctl", "-s", socket], check=False)
+    _run_interactive(["vppctl", "-s", socket])
 
 
 def cmd_shell_nat(ctx, args: list[str]) -> None:
@@ -52,7 +89,7 @@ def cmd_shell_module(ctx, args: list[str]) -> None:
     """Open VPP module CLI."""
     if not args:
         # List available modules
-        modules = list_running_modules()
+        modules = list_running_modules(ctx.prompt_tick)
         if modules:
             print("Available module shells:")
             for m in modules:
@@ -64,9 +101,9 @@ def cmd_shell_module(ctx, args: list[str]) -> None:
 
     module_name = args[0]
     socket = get_vpp_socket(module_name)
-    if not Path(socket).exists():
+    if not _exists(socket):
         error(f"VPP {module_name} socket not found: {socket}")
         return
     log(f"Entering VPP {module_name} CLI...")
     print("Type 'quit' to return\n")
-    subprocess.run(["vppctl", "-s", socket], check=False)
+    _run_interactive(["vppctl", "-s", socket])
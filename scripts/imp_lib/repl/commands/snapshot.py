@@ -5,24 +5,83 @@ This module provides commands for ZFS snapshot management
 (list, create, delete, export, import, rollback).
 
 These commands delegate to the `imp snapshot` CLI for the actual operations.
+The CLI script is loaded once and called in-process rather than spawned.
 """
 
-import subprocess
+import argparse
+import importlib.machinery
+import importlib.util
+import shutil
 
 from imp_lib.common import error
 
+# Loaded `imp` CLI module; False once loading has failed
+_IMP_CLI = None
+
+# Option parsers for the REPL forms of export/import, built once
+_EXPORT_PARSER = argparse.ArgumentParser(prog="snapshot export", add_help=False)
+_EXPORT_PARSER.add_argument("name")
+_EXPORT_PARSER.add_argument("--full", action="store_true")
+_EXPORT_PARSER.add_argument("--clean", action="store_true")
+_EXPORT_PARSER.add_argument("-o", "--output")
+
+_IMPORT_PARSER = argparse.ArgumentParser(prog="snapshot import", add_help=False)
+_IMPORT_PARSER.add_argument("file")
+_IMPORT_PARSER.add_argument("--persistent", action="store_true")
+_IMPORT_PARSER.add_argument("-n", "--name")
+
+
+def _parse(parser: argparse.ArgumentParser, args: list[str]):
+    """Parse REPL args, returning None (after argparse prints why) on error."""
+    try:
+        ns, _ = parser.parse_known_args(args)
+    except SystemExit:
+        return None
+    return ns
+
+
+def _imp_cli():
+    """Load the `imp` CLI script from PATH as a module (once)."""
+    global _IMP_CLI
+    if _IMP_CLI is None:
+        _IMP_CLI = False
+        path = shutil.which("imp")
+        if path:
+            try:
+                loader = importlib.machinery.SourceFileLoader("imp_cli", path)
+                spec = importlib.util.spec_from_loader("imp_cli", loader)
+                module = importlib.util.module_from_spec(spec)
+                loader.exec_module(module)
+                _IMP_CLI = module
+            except Exception as e:
+                error(f"Failed to load imp CLI from {path}: {e}")
+    return _IMP_CLI or None
+
+
+def _run_imp(argv: list[str]) -> None:
+    """Run an `imp` CLI command in-process."""
+    cli = _imp_cli()
+    if cli is None:
+        error("imp CLI not found in PATH")
+        return
+    try:
+        cli.main(argv)
+    except SystemExit:
+        # argparse exits on usage errors; keep the REPL running
+        pass
+
 
 def cmd_snapshot_list(ctx, args: list[str]) -> None:
     """List all snapshots."""
-    subprocess.run(["imp", "snapshot", "list"], check=False)
+    _run_imp(["snapshot", "list"])
 
 
 def cmd_snapshot_create(ctx, args: list[str]) -> None:
     """Create a snapshot."""
-    cmd = ["imp", "snapshot", "create"]
+    cmd = ["snapshot", "create"]
     if args:
         cmd.append(args[0])  # Optional snapshot name
-    subprocess.run(cmd, check=False)
+    _run_imp(cmd)
 
 
 def cmd_snapshot_delete(ctx, args: list[str]) -> None:
@@ -31,7 +90,7 @@ def cmd_snapshot_delete(ctx, args: list[str]) -> None:
         error("Usage: delete <name>")
         print("  Use 'snapshot list' to see available snapshots")
         return
-    subprocess.run(["imp", "snapshot", "delete", args[0]], check=False)
+    _run_imp(["snapshot", "delete", args[0]])
 
 
 def cmd_snapshot_export(ctx, args: list[str]) -> None:
@@ -42,21 +101,19 @@ def cmd_snapshot_export(ctx, args: list[str]) -> None:
         print("  --clean: Remove generated configs for deployment image")
         return
 
-    cmd = ["imp", "snapshot", "export", args[0]]
+    ns = _parse(_EXPORT_PARSER, args)
+    if ns is None:
+        return
 
-    # Parse remaining args for --full, --clean, and -o
-    i = 1
-    while i < len(args):
-        if args[i] == "--full":
-            cmd.append("--full")
-        elif args[i] == "--clean":
-            cmd.append("--clean")
-        elif args[i] in ("-o", "--output") and i + 1 < len(args):
-            cmd.extend(["-o", args[i + 1]])
-            i += 1
-        i += 1
+    cmd = ["snapshot", "export", ns.name]
+    if ns.full:
+        cmd.append("--full")
+    if ns.clean:
+        cmd.append("--clean")
+    if ns.output:
+        cmd.extend(["-o", ns.output])
 
-    subprocess.run(cmd, check=False)
+    _run_imp(cmd)
 
 
 def cmd_snapshot_import(ctx, args: list[str]) -> None:
@@ -65,19 +122,17 @@ def cmd_snapshot_import(ctx, args: list[str]) -> None:
         error("Usage: import <file> [-n name] [--persistent]")
         return
 
-    cmd = ["imp", "snapshot", "import", args[0]]
+    ns = _parse(_IMPORT_PARSER, args)
+    if ns is None:
+        return
 
-    # Parse remaining args
-    i = 1
-    while i < len(args):
-        if args[i] == "--persistent":
-            cmd.append("--persistent")
-        elif args[i] in ("-n", "--name") and i + 1 < len(args):
-            cmd.extend(["-n", args[i + 1]])
-            i += 1
-        i += 1
+    cmd = ["snapshot", "import", ns.file]
+    if ns.persistent:
+        cmd.append("--persistent")
+    if ns.name:
+        cmd.extend(["-n", ns.name])
 
-    subprocess.run(cmd, check=False)
+    _run_imp(cmd)
 
 
 def cmd_snapshot_rollback(ctx, args: list[str]) -> None:
@@ -86,4 +141,4 @@ def cmd_snapshot_rollback(ctx, args: list[str]) -> None:
         error("Usage: rollback <name>")
         print("  Use 'snapshot list' to see available snapshots")
         return
-    subprocess.run(["imp", "snapshot", "rollback", args[0]], check=False)
+    _run_imp(["snapshot", "rollback", args[0]])
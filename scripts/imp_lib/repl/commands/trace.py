@@ -6,18 +6,22 @@ through the VPP processing graph.
 """
 
 import re
-from pathlib import Path
 
 from imp_lib.common import Colors, log, error
-from imp_lib.common.vpp import vpp_exec
+from imp_lib.common.vpp import get_available_vpp_instances, vpp_exec, vpp_exec_stream
+
+# Start of each per-packet block in 'show trace' output
+_PACKET_RE = re.compile(r'^Packet \d+', re.MULTILINE)
+
+
+def _is_packet_line(line: str) -> bool:
+    """Line-wise equivalent of _PACKET_RE for streamed output."""
+    return line.startswith("Packet ") and line[7:8].isdigit()
 
-# VPP socket paths
-VPP_CORE_SOCKET = "/run/vpp/core-cli.sock"
-VPP_NAT_SOCKET = "/run/vpp/nat-cli.sock"
 
 # VPP nodes available for tracing, organized by category
 # Tuple: (node_name, description, instances) where instances is "core", "nat", or "both"
-VPP_TRACE_NODES = [
+VPP_TRACE_NODES = (
     # Interface input (capture everything at ingress)
     ("dpdk-input", "All traffic on DPDK interfaces (physical NICs)", "core"),
     ("memif-input", "All traffic on memif interfaces (inter-VPP)", "both"),
@@ -46,13 +50,18 @@ VPP_TRACE_NODES = [
     # Locally-originated
     ("ip4-local", "IPv4 packets destined to VPP itself", "both"),
     ("ip6-local", "IPv6 packets destined to VPP itself", "both"),
-]
+)
+
+# Per-instance (node_name, description) views; instance is only ever "core" or "nat"
+_TRACE_NODES_BY_INSTANCE = {
+    instance: tuple((node, desc) for node, desc, inst in VPP_TRACE_NODES if inst in ("both", instance))
+    for instance in ("core", "nat")
+}
 
 
-def get_trace_nodes_for_instance(instance: str) -> list[tuple[str, str]]:
+def get_trace_nodes_for_instance(instance: str) -> tuple[tuple[str, str], ...]:
     """Get trace nodes applicable to the given VPP instance."""
-    return [(node, desc) for node, desc, inst in VPP_TRACE_NODES
-            if inst == "both" or inst == instance]
+    return _TRACE_NODES_BY_INSTANCE.get(instance, ())
 
 
 def cmd_trace_start(ctx, args: list[str]) -> None:
@@ -131,22 +140,23 @@ def cmd_trace_status(ctx, args: list[str]) -> None:
     print(f"{Colors.BOLD}Trace Status{Colors.NC}")
     print("=" * 50)
 
+    # One /run/vpp scan covers both instances (and is shared with the rest of this prompt)
+    running = get_available_vpp_instances(ctx.prompt_tick)
     for instance in ("core", "nat"):
-        socket = VPP_CORE_SOCKET if instance == "core" else VPP_NAT_SOCKET
-        if not Path(socket).exists():
+        if instance not in running:
             print(f"  {instance}: {Colors.DIM}VPP not running{Colors.NC}")
             continue
 
-        # Get trace and count actual "Packet N" entries (across all threads)
-        success, output = vpp_exec("show trace", instance)
-        if success:
-            packets = len(re.findall(r'^Packet \d+', output, re.MULTILINE))
-            if packets > 0:
-                print(f"  {instance}: {Colors.GREEN}{packets} packets traced{Colors.NC}")
-            else:
-                print(f"  {instance}: No packets traced")
+        # Stream the trace and count actual "Packet N" entries (across all threads)
+        try:
+            packets = sum(1 for line in vpp_exec_stream("show trace", instance) if _is_packet_line(line))
+        except (OSError, RuntimeError) as e:
+            print(f"  {instance}: {Colors.RED}Error{Colors.NC} - {e}")
+            continue
+        if packets > 0:
+            print(f"  {instance}: {Colors.GREEN}{packets} packets traced{Colors.NC}")
         else:
-            print(f"  {instance}: {Colors.RED}Error{Colors.NC} - {output}")
+            print(f"  {instance}: No packets traced")
     print()
 
 
@@ -182,8 +192,7 @@ def cmd_trace_show(ctx, args: list[str]) -> None:
 
     if success:
         # Check if there are actual packet traces (not just "No packets in trace buffer" messages)
-        packets = len(re.findall(r'^Packet \d+', output, re.MULTILINE))
-        if packets > 0:
+        if _PACKET_RE.search(output):
             print(output)
         else:
             print("  No packets traced. Use 'trace start' to begin tracing.")
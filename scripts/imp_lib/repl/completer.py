@@ -5,7 +5,9 @@ This module provides context-aware command completion using prompt_toolkit.
 """
 
 import json
+import os
 from pathlib import Path
+from typing import Optional, Sequence
 
 try:
     from prompt_toolkit.completion import Completer, Completion
@@ -19,12 +21,13 @@ except ImportError:
             self.start_position = start_position
 
 from .context import MenuContext
+from .menu import flatten_menu_tree
 
 # Config file path for reading module config
 CONFIG_FILE = Path("/persistent/config/router.json")
 
 # Import module loader for show module commands
-from imp_lib.modules import load_module_definition
+from imp_lib.modules import load_module_definition, MODULE_DEFINITIONS_DIR
 MODULE_LOADER_AVAILABLE = True
 
 # Import shell helpers for running module discovery
@@ -33,16 +36,40 @@ try:
     VPP_HELPER_AVAILABLE = True
 except ImportError:
     VPP_HELPER_AVAILABLE = False
-    def get_available_vpp_instances():
+    def get_available_vpp_instances(tick=None):
         return []
 
 
+# Static completion word sets, shared rather than rebuilt per keystroke
+_BASE_COMMANDS = ("help", "exit")
+_NAV_COMMANDS = ("back", "home")
+_ROOT_COMMANDS = ("show", "status", "reload")
+_SUBINTERFACE_COMMANDS = ("list", "add", "delete")
+_ROUTE_COMMANDS = ("list", "add", "delete", "set-default-v4", "set-default-v6")
+_INTERFACE_COMMANDS = ("show", "set-ipv4", "set-ipv6", "set-mtu", "delete", "subinterfaces", "ospf", "ospf6", "ipv6-ra")
+_IPV6_RA_COMMANDS = ("enable", "disable", "suppress", "no-suppress", "interval", "prefix")
+_OSPF_COMMANDS = ("ospf", "ospf6")
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of path, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 class MenuCompleter(Completer):
     """Dynamic completer that provides context-aware completions."""
 
     def __init__(self, ctx: MenuContext, menus: dict):
         self.ctx = ctx
         self.menus = menus
+        # Completion caches validated by file mtime (None stamp = file missing)
+        self._cfg_cache: Optional[tuple] = None
+        self._show_cmd_cache: dict[str, tuple[Optional[int], list[str]]] = {}
+        self._flat_menus = flatten_menu_tree(menus)  # Path tuple -> static menu node
+        self._lower_cache: dict[str, str] = {}  # Candidate -> lowercased form
 
     def get_completions(self, document, complete_event):
         text = document.text_before_cursor
@@ -63,37 +90,48 @@ class MenuCompleter(Completer):
             word = words[-1].lower()
 
         # Yield matching completions
+        if not word:
+            for item in completions:
+                yield Completion(item, start_position=0)
+            return
+        lower = self._lower_cache
+        start = -len(word)
         for item in completions:
-            if item.lower().startswith(word):
-                yield Completion(item, start_position=-len(word))
+            item_lower = lower.get(item)
+            if item_lower is None:
+                item_lower = lower[item] = item.lower()
+            if item_lower.startswith(word):
+                yield Completion(item, start_position=start)
 
-    def _get_menu_at_path(self, path: list[str]):
+    def _get_menu_at_path(self, path: tuple[str, ...]):
         """Navigate to a menu based on path segments."""
-        menu = self.menus.get("root")
-        for segment in path:
-            if menu and "children" in menu:
-                menu = menu["children"].get(segment)
-            else:
-                return None
-        return menu
+        return self._flat_menus.get(path)
 
     def _get_module_names_with_show_commands(self) -> list[str]:
         """Get list of enabled module names that have show_commands defined."""
         if not MODULE_LOADER_AVAILABLE:
             return []
+        # Only the router.json parse is cached; load_module_definition revalidates
+        # each module YAML by stat, so in-place edits to show_commands are seen
+        stamp = _mtime_ns(CONFIG_FILE)
+        if self._cfg_cache is None or self._cfg_cache[0] != stamp:
+            enabled = []
+            if stamp is not None:
+                try:
+                    with open(CONFIG_FILE) as f:
+                        config_data = json.load(f)
+                    enabled = [
+                        mod["name"] for mod in config_data.get("modules", [])
+                        if mod.get("enabled") and mod.get("name")
+                    ]
+                except Exception:
+                    pass
+            self._cfg_cache = (stamp, enabled)
         modules = []
-        if CONFIG_FILE.exists():
+        for name in self._cfg_cache[1]:
             try:
-                with open(CONFIG_FILE) as f:
-                    config_data = json.load(f)
-                for mod in config_data.get("modules", []):
-                    if mod.get("enabled") and mod.get("name"):
-                        try:
-                            mod_def = load_module_definition(mod["name"])
-                            if mod_def.show_commands:
-                                modules.append(mod["name"])
-                        except Exception:
-                            pass
+                if load_module_definition(name).show_commands:
+                    modules.append(name)
             except Exception:
                 pass
         return modules
@@ -102,11 +140,17 @@ class MenuCompleter(Completer):
         """Get list of show command names for a specific module."""
         if not MODULE_LOADER_AVAILABLE:
             return []
+        stamp = _mtime_ns(MODULE_DEFINITIONS_DIR / f"{module_name}.yaml")
+        cached = self._show_cmd_cache.get(module_name)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
         try:
             mod_def = load_module_definition(module_name)
-            return [cmd.name for cmd in mod_def.show_commands]
+            names = [cmd.name for cmd in mod_def.show_commands]
         except Exception:
-            return []
+            names = []
+        self._show_cmd_cache[module_name] = (stamp, names)
+        return names
 
     def _get_menu_completions(self, cmd_prefix: list[str]) -> list[str]:
         """Get available commands and submenus for given context.
@@ -117,25 +161,19 @@ class MenuCompleter(Completer):
         completions = []
 
         # Build effective path: current menu path + typed command prefix
-        effective_path = self.ctx.path + cmd_prefix
+        effective_path = self.ctx.path + tuple(cmd_prefix)
 
         # Handle "show" command completions (it's a global command, not a menu)
         if not self.ctx.path or self.ctx.path[0] != "config":
             # At root or non-config menu - show is for live state
-            if cmd_prefix == ["show"]:
-                return ["interfaces", "ip", "ipv6", "neighbors", "bgp", "ospf", "module", "config"]
-            if cmd_prefix == ["show", "ip"]:
-                return ["route", "fib"]
-            if cmd_prefix == ["show", "ipv6"]:
-                return ["route", "fib"]
-            if cmd_prefix == ["show", "module"]:
-                # Return enabled modules with show_commands
-                return self._get_module_names_with_show_commands()
-            if len(cmd_prefix) == 3 and cmd_prefix[0] == "show" and cmd_prefix[1] == "module":
-                # Return show commands for the specific module
-                return self._get_module_show_commands(cmd_prefix[2])
-            if cmd_prefix == ["show", "config"]:
-                return ["interfaces", "loopbacks", "bvi", "vlan-passthrough", "routing", "modules", "containers", "cpu"]
+            if cmd_prefix and cmd_prefix[0] == "show":
+                show_completions = self._complete_show(cmd_prefix[1:])
+                if show_completions is not None:
+                    return show_completions
+
+        # "apply force" re-applies even when nothing changed this session
+        if len(cmd_prefix) == 1 and cmd_prefix[0] == "apply":
+            return ["force"]
 
         # Navigate to the menu at this effective path
         menu = self._get_menu_at_path(effective_path)
@@ -147,23 +185,21 @@ class MenuCompleter(Completer):
         # Only show global commands at the current menu level (not when completing subcommands)
         if not cmd_prefix:
             # Commands available everywhere
-            base_commands = ["help", "exit"]
+            completions.extend(_BASE_COMMANDS)
 
             # Navigation commands only when not at root
             if self.ctx.path:
-                base_commands.extend(["back", "home"])
+                completions.extend(_NAV_COMMANDS)
 
             # Root-only commands
             if not self.ctx.path:
-                base_commands.extend(["show", "status", "reload"])
-                # Apply only when there are unsaved changes
+                completions.extend(_ROOT_COMMANDS)
+                # Apply only when there are unsaved changes ("apply force" completes regardless)
                 if self.ctx.dirty:
-                    base_commands.append("apply")
+                    completions.append("apply")
             # At config level, show is for viewing config sections
-            elif self.ctx.path == ["config"]:
-                base_commands.append("show")
-
-            completions.extend(base_commands)
+            elif self.ctx.path == ("config",):
+                completions.append("show")
 
         if menu:
             # Menu-specific commands from static menu definition
@@ -175,101 +211,157 @@ class MenuCompleter(Completer):
                 completions.extend(menu["children"].keys())
 
         # Dynamic completions based on effective path
+        key = effective_path
+        exact = self._EXACT_PATH_COMPLETERS.get(key)
+        if exact:
+            completions.extend(exact(self))
+        if len(key) >= 3:
+            section = self._SECTION_COMPLETERS.get(key[:2])
+            if section:
+                completions.extend(section(self, key))
+
+        if len(key) >= 4 and key[-1] == "subinterfaces":
+            # Add sub-interface commands
+            completions.extend(_SUBINTERFACE_COMMANDS)
 
-        # Shell menu - add running VPP module instances
-        if effective_path == ["shell"] and VPP_HELPER_AVAILABLE:
-            # Add running module names (excludes core which is already static)
-            for instance in get_available_vpp_instances():
-                if instance != "core":
-                    completions.append(instance)
+        return list(dict.fromkeys(completions))  # Remove duplicates, keep menu order
 
-        if effective_path == ["config", "interfaces"] and self.ctx.config:
-            # Add interface names from config (dynamic children)
-            completions.extend(i.name for i in self.ctx.config.interfaces)
+    # Completers for an exact effective path; each returns names to offer
 
-        if len(effective_path) == 3 and effective_path[:2] == ["config", "interfaces"] and self.ctx.config:
-            # After selecting an interface name, show commands
-            iface_name = effective_path[2]
-            if iface_name not in ("management", "show", "list", "add"):
-                if any(i.name == iface_name for i in self.ctx.config.interfaces):
-                    completions.extend(["show", "set-ipv4", "set-ipv6", "set-mtu", "delete", "subinterfaces", "ospf", "ospf6", "ipv6-ra"])
+    def _complete_shell(self) -> Sequence[str]:
+        # Running module names (core is already a static child)
+        if not VPP_HELPER_AVAILABLE:
+            return []
+        return [i for i in get_available_vpp_instances(self.ctx.prompt_tick) if i != "core"]
 
-        # IPv6 RA subcommands
-        if len(effective_path) == 4 and effective_path[:2] == ["config", "interfaces"] and effective_path[3] == "ipv6-ra":
-            completions.extend(["enable", "disable", "suppress", "no-suppress", "interval", "prefix"])
+    def _complete_interfaces(self) -> Sequence[str]:
+        # Interface names from config (dynamic children)
+        return [i.name for i in self.ctx.config.interfaces] if self.ctx.config else []
 
-        # Routes menu
-        if effective_path == ["config", "routes"] and self.ctx.config:
-            completions.extend(["list", "add", "delete", "set-default-v4", "set-default-v6"])
+    def _complete_routes(self) -> Sequence[str]:
+        return _ROUTE_COMMANDS if self.ctx.config else ()
 
-        if len(effective_path) >= 4 and effective_path[-1] == "subinterfaces":
-            # Add sub-interface commands
-            completions.extend(["list", "add", "delete"])
+    def _complete_modules(self) -> Sequence[str]:
+        # Module names present in config
+        if not self.ctx.config:
+            return []
+        return [mod["name"] for mod in self.ctx.config.modules if mod.get("name")]
 
-        if len(effective_path) == 3 and effective_path[:2] == ["config", "loopbacks"]:
-            # After "delete" or "edit", show loopback instance numbers
-            if effective_path[2] in ("delete", "edit") and self.ctx.config:
-                for lo in self.ctx.config.loopbacks:
-                    completions.append(str(lo.instance))
+    # Completers for paths below a config section (path has 3+ segments)
 
-        if len(effective_path) == 4 and effective_path[:2] == ["config", "loopbacks"]:
+    def _complete_interface_section(self, path: tuple) -> Sequence[str]:
+        if len(path) == 3 and self.ctx.config:
+            # After selecting an interface name, show commands
+            if path[2] not in ("management", "show", "list", "add") and self.ctx.config.get_interface(path[2]):
+                return _INTERFACE_COMMANDS
+        elif len(path) == 4 and path[3] == "ipv6-ra":
+            return _IPV6_RA_COMMANDS
+        return []
+
+    def _complete_loopback_section(self, path: tuple) -> Sequence[str]:
+        if len(path) == 3:
+            # After "delete" or "edit", show loopback instance numbers
+            if path[2] in ("delete", "edit") and self.ctx.config:
+                return [str(lo.instance) for lo in self.ctx.config.loopbacks]
+        elif len(path) == 4 and path[2] not in ("delete", "edit", "add"):
             # After selecting a loopback instance, show OSPF commands
-            if effective_path[2] not in ("delete", "edit", "add"):
-                completions.extend(["ospf", "ospf6"])
+            return _OSPF_COMMANDS
+        return []
 
-        if len(effective_path) == 3 and effective_path[:2] == ["config", "bvi"]:
+    def _complete_bvi_section(self, path: tuple) -> Sequence[str]:
+        if len(path) == 3:
             # After "delete" or "edit", show BVI bridge IDs
-            if effective_path[2] in ("delete", "edit") and self.ctx.config:
-                for bvi in self.ctx.config.bvi_domains:
-                    completions.append(str(bvi.bridge_id))
-
-        if len(effective_path) == 4 and effective_path[:2] == ["config", "bvi"]:
+            if path[2] in ("delete", "edit") and self.ctx.config:
+                return [str(bvi.bridge_id) for bvi in self.ctx.config.bvi_domains]
+        elif len(path) == 4 and path[2] not in ("delete", "edit", "add"):
             # After selecting a BVI, show OSPF commands
-            if effective_path[2] not in ("delete", "edit", "add"):
-                completions.extend(["ospf", "ospf6"])
-
-        if len(effective_path) == 3 and effective_path[:2] == ["config", "vlan-passthrough"]:
-            # After "delete", show VLAN IDs
-            if effective_path[2] == "delete" and self.ctx.config:
-                for v in self.ctx.config.vlan_passthrough:
-                    completions.append(str(v.vlan_id))
-
-        # Dynamic module completions
-        if effective_path == ["config", "modules"] and self.ctx.config:
-            # Show installed module names
-            for mod in self.ctx.config.modules:
-                if mod.get("name"):
-                    completions.append(mod["name"])
-
-        if len(effective_path) >= 3 and effective_path[:2] == ["config", "modules"] and MODULE_LOADER_AVAILABLE:
-            # Inside a module - show commands from module definition
-            module_name = effective_path[2]
-            # Current subpath within module: ["config", "modules", "nat", "mappings"] -> ["mappings"]
-            module_subpath = effective_path[3:]
+            return _OSPF_COMMANDS
+        return []
 
-            try:
-                mod_def = load_module_definition(module_name)
-
-                # Build prefix to match against command paths
-                prefix = "/".join(module_subpath) + "/" if module_subpath else ""
-
-                # Find matching commands
-                matching_cmds = set()
-                for cmd in mod_def.cli_commands:
-                    if prefix:
-                        # We're in a subpath - show matching suffixes
-                        if cmd.path.startswith(prefix):
-                            # "mappings/add" with prefix "mappings/" -> "add"
-                            remaining = cmd.path[len(prefix):]
-                            if "/" not in remaining:
-                                matching_cmds.add(remaining)
-                    else:
-                        # At module root - show top-level command parts
-                        first_part = cmd.path.split("/")[0]
-                        matching_cmds.add(first_part)
-
-                completions.extend(matching_cmds)
-            except Exception:
-                pass
+    def _complete_vlan_passthrough_section(self, path: tuple) -> Sequence[str]:
+        # After "delete", show VLAN IDs
+        if len(path) == 3 and path[2] == "delete" and self.ctx.config:
+            return [str(v.vlan_id) for v in self.ctx.config.vlan_passthrough]
+        return []
+
+    def _complete_module_section(self, path: tuple) -> Sequence[str]:
+        # Inside a module - show commands from module definition
+        if not MODULE_LOADER_AVAILABLE:
+            return []
+        module_name = path[2]
+        # Current subpath within module: ("config", "modules", "nat", "mappings") -> ("mappings",)
+        module_subpath = path[3:]
 
-        return list(set(completions))  # Remove duplicates
+        try:
+            mod_def = load_module_definition(module_name)
+        except Exception:
+            return []
+
+        # Build prefix to match against command paths
+        prefix = "/".join(module_subpath) + "/" if module_subpath else ""
+
+        # Find matching commands
+        matching_cmds = {}
+        for cmd in mod_def.cli_commands:
+            if prefix:
+                # We're in a subpath - show matching suffixes
+                if cmd.path.startswith(prefix):
+                    # "mappings/add" with prefix "mappings/" -> "add"
+                    remaining = cmd.path[len(prefix):]
+                    if "/" not in remaining:
+                        matching_cmds[remaining] = None
+            else:
+                # At module root - show top-level command parts
+                matching_cmds[cmd.path.split("/")[0]] = None
+        return list(matching_cmds)
+
+    def _complete_show(self, words: list[str]) -> Optional[list[str]]:
+        """Walk _SHOW_TRIE with the words typed after "show"; None if there is no match."""
+        node = self._SHOW_TRIE
+        for i, word in enumerate(words):
+            if callable(node):
+                return node(self, words[i:])
+            if not isinstance(node, dict) or word not in node:
+                return None
+            node = node[word]
+        if callable(node):
+            return node(self, [])
+        return list(node) if isinstance(node, dict) else None
+
+    def _complete_show_module(self, words: list[str]) -> Optional[list[str]]:
+        if not words:
+            # Enabled modules with show_commands
+            return self._get_module_names_with_show_commands()
+        if len(words) == 1:
+            # Show commands for the specific module
+            return self._get_module_show_commands(words[0])
+        return None
+
+    # Live-state "show" completions outside the config menu, as a trie of the words
+    # after "show": dict = static children, None = leaf, callable = dynamic subtree
+    _SHOW_TRIE = {
+        "interfaces": None,
+        "ip": {"route": None, "fib": None},
+        "ipv6": {"route": None, "fib": None},
+        "neighbors": None,
+        "bgp": None,
+        "ospf": None,
+        "module": _complete_show_module,
+        "config": dict.fromkeys(("interfaces", "loopbacks", "bvi", "vlan-passthrough", "routing", "modules", "containers", "cpu")),
+    }
+
+    _EXACT_PATH_COMPLETERS = {
+        ("shell",): _complete_shell,
+        ("config", "interfaces"): _complete_interfaces,
+        ("config", "routes"): _complete_routes,
+        ("config", "modules"): _complete_modules,
+    }
+
+    # Keyed by the first two segments of a 3+ segment path
+    _SECTION_COMPLETERS = {
+        ("config", "interfaces"): _complete_interface_section,
+        ("config", "loopbacks"): _complete_loopback_section,
+        ("config", "bvi"): _complete_bvi_section,
+        ("config", "vlan-passthrough"): _complete_vlan_passthrough_section,
+        ("config", "modules"): _complete_module_section,
+    }
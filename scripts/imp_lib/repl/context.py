@@ -6,25 +6,29 @@ This module contains:
 - get_prompt_text: Generates the prompt string based on current menu path
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Any
 
 
 @dataclass
 class MenuContext:
     """Tracks current position in menu hierarchy and configuration state."""
-    path: list[str] = field(default_factory=list)
+    path: tuple[str, ...] = ()  # Immutable; navigation rebinds it
     config: Optional[Any] = None  # RouterConfig when available
     dirty: bool = False
-    original_json: str = ""  # For detecting changes
+    applied_config: Optional[Any] = None  # Copy of the last config fully applied this session
+    prompt_tick: int = 0  # Bumped before each prompt; keys per-prompt caches
 
 
 def get_prompt_text(ctx: MenuContext) -> str:
     """Generate the prompt string based on current menu path."""
-    if ctx.path:
-        path_str = ".".join(ctx.path)
-        dirty_marker = "*" if ctx.dirty else ""
-        return f"imp.{path_str}{dirty_marker}> "
-    else:
-        dirty_marker = "*" if ctx.dirty else ""
-        return f"imp{dirty_marker}> "
+    return _format_prompt(ctx.path, ctx.dirty)
+
+
+@lru_cache(maxsize=64)
+def _format_prompt(path: tuple[str, ...], dirty: bool) -> str:
+    dirty_marker = "*" if dirty else ""
+    if path:
+        return f"imp.{'.'.join(path)}{dirty_marker}> "
+    return f"imp{dirty_marker}> "
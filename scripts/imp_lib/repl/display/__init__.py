@@ -4,6 +4,7 @@ imp_lib.repl.display - Display functions for REPL
 This package contains functions for displaying configuration and live state:
 - config: Functions for displaying staged configuration
 - live: Functions for displaying live VPP/FRR state
+- io: Output buffering helpers
 """
 
 from .config import (
@@ -39,6 +40,8 @@ from .live import (
     pager,
 )
 
+from .io import buffered_stdout
+
 __all__ = [
     # Config display
     'get_nat_config',
@@ -69,4 +72,6 @@ __all__ = [
     'show_live_module',
     'filter_fib_output',
     'pager',
+    # Output helpers
+    'buffered_stdout',
 ]
@@ -4,21 +4,52 @@ Configuration display functions for IMP REPL.
 These functions display the staged configuration state to the user.
 """
 
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, List, Optional
 
 from imp_lib.common import Colors, warn
+from .io import buffered_stdout
 
 
 def get_nat_config(config) -> Optional[dict]:
     """Get NAT config from modules list, returns dict or None."""
-    if not config or not hasattr(config, 'modules') or not config.modules:
+    if not config:
         return None
-    for module in config.modules:
-        if module.get('name') == 'nat' and module.get('enabled', False):
-            return module.get('config', {})
+    module = config.get_module('nat')
+    if module and module.get('enabled', False):
+        return module.get('config', {})
     return None
 
 
+def _addr_pair_str(obj) -> str:
+    """Format an object's single IPv4/IPv6 address pair as 'v4/len, v6/len'."""
+    return _format_addr_pair(obj.ipv4, obj.ipv4_prefix, obj.ipv6, obj.ipv6_prefix)
+
+
+@lru_cache(maxsize=256)
+def _format_addr_pair(ipv4, ipv4_prefix, ipv6, ipv6_prefix) -> str:
+    # Keyed on the field values, so in-place config edits never see a stale string
+    if ipv4 and ipv6:
+        return f"{ipv4}/{ipv4_prefix}, {ipv6}/{ipv6_prefix}"
+    elif ipv4:
+        return f"{ipv4}/{ipv4_prefix}"
+    elif ipv6:
+        return f"{ipv6}/{ipv6_prefix}"
+    return ""
+
+
+def _subif_lines(subifs, indent: str) -> str:
+    """Render one '.vlan: addresses (LCP)' line per subinterface."""
+    # Bound locally: evaluated once per subinterface
+    addr_pair = _addr_pair_str
+    return "\n".join([
+        f"{indent}.{sub.vlan_id}: {addr_pair(sub)}{' (LCP)' if sub.create_lcp else ''}"
+        for sub in subifs
+    ])
+
+
+@buffered_stdout()
 def show_interfaces(config) -> None:
     """Show interfaces summary."""
     print(f"{Colors.BOLD}Interfaces{Colors.NC}")
@@ -32,25 +63,20 @@ def show_interfaces(config) -> None:
             print(f"  management  {m.iface} -> {m.ipv4}/{m.ipv4_prefix}")
 
     for iface in config.interfaces:
-        ipv4_str = ", ".join(f"{a.address}/{a.prefix}" for a in iface.ipv4) if iface.ipv4 else "none"
+        ipv4_str = ", ".join([f"{a.address}/{a.prefix}" for a in iface.ipv4]) if iface.ipv4 else "none"
         mtu_str = f" MTU:{iface.mtu}" if iface.mtu != 1500 else ""
         print(f"  {iface.name:<12} {iface.iface} -> {ipv4_str}{mtu_str}")
         for addr in iface.ipv6:
             print(f"               IPv6: {addr.address}/{addr.prefix}")
-        for sub in iface.subinterfaces:
-            ips = []
-            if sub.ipv4:
-                ips.append(f"{sub.ipv4}/{sub.ipv4_prefix}")
-            if sub.ipv6:
-                ips.append(f"{sub.ipv6}/{sub.ipv6_prefix}")
-            lcp = " (LCP)" if sub.create_lcp else ""
-            print(f"    .{sub.vlan_id}: {', '.join(ips)}{lcp}")
+        if iface.subinterfaces:
+            print(_subif_lines(iface.subinterfaces, "    "))
 
     print()
     print("Enter an interface name to see details (e.g., 'wan', 'lan')")
     print()
 
 
+@buffered_stdout()
 def show_interface_detail(iface) -> None:
     """Show interface details."""
     print(f"{Colors.BOLD}Interface: {iface.name}{Colors.NC}")
@@ -88,19 +114,13 @@ def show_interface_detail(iface) -> None:
     print()
     if iface.subinterfaces:
         print("Sub-interfaces:")
-        for sub in iface.subinterfaces:
-            ips = []
-            if sub.ipv4:
-                ips.append(f"{sub.ipv4}/{sub.ipv4_prefix}")
-            if sub.ipv6:
-                ips.append(f"{sub.ipv6}/{sub.ipv6_prefix}")
-            lcp = " (LCP)" if sub.create_lcp else ""
-            print(f"  .{sub.vlan_id}: {', '.join(ips)}{lcp}")
+        print(_subif_lines(iface.subinterfaces, "  "))
         print()
     print("Commands: set-ipv4, set-ipv6, set-mtu, subinterfaces, ospf, ospf6, ipv6-ra")
     print()
 
 
+@buffered_stdout()
 def show_routes(config) -> None:
     """Show static routes."""
     print(f"{Colors.BOLD}Static Routes{Colors.NC}")
@@ -117,6 +137,7 @@ def show_routes(config) -> None:
     print()
 
 
+@buffered_stdout()
 def show_management(config) -> None:
     """Show management interface details."""
     if not config.management:
@@ -134,6 +155,7 @@ def show_management(config) -> None:
     print()
 
 
+@buffered_stdout()
 def show_subinterfaces(subifs: list, parent: str) -> None:
     """Show sub-interfaces for a parent interface."""
     print(f"{Colors.BOLD}Sub-interfaces on {parent}{Colors.NC}")
@@ -141,17 +163,11 @@ def show_subinterfaces(subifs: list, parent: str) -> None:
     if not subifs:
         print("  (none configured)")
     else:
-        for sub in subifs:
-            ips = []
-            if sub.ipv4:
-                ips.append(f"{sub.ipv4}/{sub.ipv4_prefix}")
-            if sub.ipv6:
-                ips.append(f"{sub.ipv6}/{sub.ipv6_prefix}")
-            lcp = " (LCP)" if sub.create_lcp else ""
-            print(f"  .{sub.vlan_id}: {', '.join(ips)}{lcp}")
+        print(_subif_lines(subifs, "  "))
     print()
 
 
+@buffered_stdout()
 def show_loopbacks(config) -> None:
     """Show loopback interfaces."""
     print(f"{Colors.BOLD}Loopback Interfaces{Colors.NC}")
@@ -160,16 +176,13 @@ def show_loopbacks(config) -> None:
         print("  (none configured)")
     else:
         for lo in config.loopbacks:
-            ips = []
-            if lo.ipv4:
-                ips.append(f"{lo.ipv4}/{lo.ipv4_prefix}")
-            if lo.ipv6:
-                ips.append(f"{lo.ipv6}/{lo.ipv6_prefix}")
+            ips_str = _addr_pair_str(lo)
             lcp = " (LCP)" if lo.create_lcp else ""
-            print(f"  loop{lo.instance} ({lo.name}): {', '.join(ips)}{lcp}")
+            print(f"  loop{lo.instance} ({lo.name}): {ips_str}{lcp}")
     print()
 
 
+@buffered_stdout()
 def show_bvi(config) -> None:
     """Show BVI domains."""
     print(f"{Colors.BOLD}BVI Domains{Colors.NC}")
@@ -178,21 +191,18 @@ def show_bvi(config) -> None:
         print("  (none configured)")
     else:
         for bvi in config.bvi_domains:
-            ips = []
-            if bvi.ipv4:
-                ips.append(f"{bvi.ipv4}/{bvi.ipv4_prefix}")
-            if bvi.ipv6:
-                ips.append(f"{bvi.ipv6}/{bvi.ipv6_prefix}")
+            ips_str = _addr_pair_str(bvi)
             lcp = " (LCP)" if bvi.create_lcp else ""
-            members = ", ".join(
+            members = ", ".join([
                 f"{m.interface}.{m.vlan_id}" if m.vlan_id else m.interface
                 for m in bvi.members
-            )
-            print(f"  loop{bvi.bridge_id} ({bvi.name}): {', '.join(ips)}{lcp}")
+            ])
+            print(f"  loop{bvi.bridge_id} ({bvi.name}): {ips_str}{lcp}")
             print(f"    Members: {members}")
     print()
 
 
+@buffered_stdout()
 def show_vlan_passthrough(config) -> None:
     """Show VLAN passthrough config."""
     print(f"{Colors.BOLD}VLAN Pass-through{Colors.NC}")
@@ -210,6 +220,7 @@ def show_vlan_passthrough(config) -> None:
     print()
 
 
+@buffered_stdout()
 def show_routing(config) -> None:
     """Show routing summary."""
     print(f"{Colors.BOLD}Routing{Colors.NC}")
@@ -230,6 +241,7 @@ def show_routing(config) -> None:
     print()
 
 
+@buffered_stdout()
 def show_bgp(config) -> None:
     """Show BGP configuration."""
     print(f"{Colors.BOLD}BGP Configuration{Colors.NC}")
@@ -258,6 +270,32 @@ def show_bgp(config) -> None:
     print()
 
 
+def _iter_ospf_areas(config, area_attr: str, passive_attr: str):
+    """Yield (label, area, passive) for every interface with area_attr set."""
+    get_area = attrgetter(area_attr)
+    get_passive = attrgetter(passive_attr)
+    # Loopbacks
+    for loop in config.loopbacks:
+        area = get_area(loop)
+        if area is not None:
+            yield f"loop{loop.instance}", area, get_passive(loop)
+    # Dataplane interfaces
+    for iface in config.interfaces:
+        area = get_area(iface)
+        if area is not None:
+            yield iface.name, area, get_passive(iface)
+        for sub in iface.subinterfaces:
+            area = get_area(sub)
+            if area is not None:
+                yield f"{iface.name}.{sub.vlan_id}", area, get_passive(sub)
+    # BVI interfaces
+    for bvi in config.bvi_domains:
+        area = get_area(bvi)
+        if area is not None:
+            yield f"loop{bvi.bridge_id}", area, get_passive(bvi)
+
+
+@buffered_stdout()
 def show_ospf(config) -> None:
     """Show OSPF configuration."""
     print(f"{Colors.BOLD}OSPF Configuration{Colors.NC}")
@@ -271,34 +309,15 @@ def show_ospf(config) -> None:
         print()
         print(f"  {Colors.BOLD}Interface Areas:{Colors.NC}")
         has_areas = False
-        # Loopbacks
-        for loop in config.loopbacks:
-            if loop.ospf_area is not None:
-                passive = " (passive)" if loop.ospf_passive else ""
-                print(f"    loop{loop.instance}: area {loop.ospf_area}{passive}")
-                has_areas = True
-        # Dataplane interfaces
-        for iface in config.interfaces:
-            if iface.ospf_area is not None:
-                passive = " (passive)" if iface.ospf_passive else ""
-                print(f"    {iface.name}: area {iface.ospf_area}{passive}")
-                has_areas = True
-            for sub in iface.subinterfaces:
-                if sub.ospf_area is not None:
-                    passive = " (passive)" if sub.ospf_passive else ""
-                    print(f"    {iface.name}.{sub.vlan_id}: area {sub.ospf_area}{passive}")
-                    has_areas = True
-        # BVI interfaces
-        for bvi in config.bvi_domains:
-            if bvi.ospf_area is not None:
-                passive = " (passive)" if bvi.ospf_passive else ""
-                print(f"    loop{bvi.bridge_id}: area {bvi.ospf_area}{passive}")
-                has_areas = True
+        for label, area, passive in _iter_ospf_areas(config, "ospf_area", "ospf_passive"):
+            print(f"    {label}: area {area}{' (passive)' if passive else ''}")
+            has_areas = True
         if not has_areas:
             print("    (no interfaces configured)")
     print()
 
 
+@buffered_stdout()
 def show_ospf6(config) -> None:
     """Show OSPFv3 configuration."""
     print(f"{Colors.BOLD}OSPFv3 Configuration{Colors.NC}")
@@ -312,34 +331,15 @@ def show_ospf6(config) -> None:
         print()
         print(f"  {Colors.BOLD}Interface Areas:{Colors.NC}")
         has_areas = False
-        # Loopbacks
-        for loop in config.loopbacks:
-            if loop.ospf6_area is not None:
-                passive = " (passive)" if loop.ospf6_passive else ""
-                print(f"    loop{loop.instance}: area {loop.ospf6_area}{passive}")
-                has_areas = True
-        # Dataplane interfaces
-        for iface in config.interfaces:
-            if iface.ospf6_area is not None:
-                passive = " (passive)" if iface.ospf6_passive else ""
-                print(f"    {iface.name}: area {iface.ospf6_area}{passive}")
-                has_areas = True
-            for sub in iface.subinterfaces:
-                if sub.ospf6_area is not None:
-                    passive = " (passive)" if sub.ospf6_passive else ""
-                    print(f"    {iface.name}.{sub.vlan_id}: area {sub.ospf6_area}{passive}")
-                    has_areas = True
-        # BVI interfaces
-        for bvi in config.bvi_domains:
-            if bvi.ospf6_area is not None:
-                passive = " (passive)" if bvi.ospf6_passive else ""
-                print(f"    loop{bvi.bridge_id}: area {bvi.ospf6_area}{passive}")
-                has_areas = True
+        for label, area, passive in _iter_ospf_areas(config, "ospf6_area", "ospf6_passive"):
+            print(f"    {label}: area {area}{' (passive)' if passive else ''}")
+            has_areas = True
         if not has_areas:
             print("    (no interfaces configured)")
     print()
 
 
+@buffered_stdout()
 def show_nat(config) -> None:
     """Show NAT configuration."""
     print(f"{Colors.BOLD}NAT Configuration{Colors.NC}")
@@ -355,6 +355,14 @@ def show_nat(config) -> None:
     print()
 
 
+def _field_getters(items: list, *names: str) -> tuple:
+    """Return one getter per name, picked once for dict or dataclass items."""
+    if isinstance(items[0], dict):
+        return tuple((lambda item, name=name: item.get(name, '?')) for name in names)
+    return tuple(attrgetter(name) for name in names)
+
+
+@buffered_stdout()
 def show_nat_mappings(config) -> None:
     """Show NAT mappings."""
     print(f"{Colors.BOLD}NAT Mappings{Colors.NC}")
@@ -364,13 +372,13 @@ def show_nat_mappings(config) -> None:
     if not mappings:
         print("  (none configured)")
     else:
+        get_src, get_pool = _field_getters(mappings, 'source_network', 'nat_pool')
         for m in mappings:
-            src = m.get('source_network', m.source_network if hasattr(m, 'source_network') else '?')
-            pool = m.get('nat_pool', m.nat_pool if hasattr(m, 'nat_pool') else '?')
-            print(f"  {src} -> {pool}")
+            print(f"  {get_src(m)} -> {get_pool(m)}")
     print()
 
 
+@buffered_stdout()
 def show_nat_bypass(config) -> None:
     """Show NAT bypass rules."""
     print(f"{Colors.BOLD}NAT Bypass Rules{Colors.NC}")
@@ -380,13 +388,13 @@ def show_nat_bypass(config) -> None:
     if not bypass_pairs:
         print("  (none configured)")
     else:
+        get_src, get_dst = _field_getters(bypass_pairs, 'source', 'destination')
         for bp in bypass_pairs:
-            src = bp.get('source', bp.source if hasattr(bp, 'source') else '?')
-            dst = bp.get('destination', bp.destination if hasattr(bp, 'destination') else '?')
-            print(f"  {src} -> {dst}")
+            print(f"  {get_src(bp)} -> {get_dst(bp)}")
     print()
 
 
+@buffered_stdout()
 def show_containers(config) -> None:
     """Show container configuration."""
     print(f"{Colors.BOLD}Container Network{Colors.NC}")
@@ -401,6 +409,7 @@ def show_containers(config) -> None:
     print()
 
 
+@buffered_stdout()
 def show_cpu(config) -> None:
     """Show CPU allocation."""
     print(f"{Colors.BOLD}CPU Allocation{Colors.NC}")
@@ -0,0 +1,48 @@
+"""
+Output helpers for REPL display functions.
+"""
+
+import io
+import sys
+from contextlib import contextmanager
+
+from imp_lib.common.colors import set_color, use_color
+
+
+class _StdoutBuffer(io.StringIO):
+    """In-memory stdout that reports whether the stream it replaces is a TTY."""
+
+    def __init__(self, stream):
+        super().__init__()
+        self._stream = stream
+
+    def isatty(self) -> bool:
+        return self._stream is not None and self._stream.isatty()
+
+
+@contextmanager
+def buffered_stdout():
+    """
+    Collect everything printed inside the block and write it out at once.
+
+    Display functions print many short lines; on a TTY each print() is a
+    separate write. Usable as a decorator: @buffered_stdout().
+
+    Colors are decided once for the outermost block, from the stream the
+    output finally goes to, and restored on exit.
+    """
+    real_stdout = sys.stdout
+    if isinstance(real_stdout, _StdoutBuffer):
+        previous = None  # Nested block: keep the enclosing block's decision
+    else:
+        previous = set_color(use_color(real_stdout))
+    buf = _StdoutBuffer(real_stdout)
+    sys.stdout = buf
+    try:
+        yield
+    finally:
+        sys.stdout = real_stdout
+        if previous is not None:
+            set_color(previous)
+        real_stdout.write(buf.getvalue())
+        real_stdout.flush()
@@ -5,16 +5,27 @@ These functions query VPP and FRR for live operational state
 and display it to the user.
 """
 
+import io
 import ipaddress
 import json
+import os
 import re
 import shutil
+import socket
 import subprocess
+import time
 from pathlib import Path
 from typing import Optional
 
+try:
+    # Prefer orjson when installed; the stdlib parser is the fallback
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from imp_lib.common import Colors, error
 from imp_lib.common.vpp import vpp_exec
+from .io import buffered_stdout
 
 # Import module loader for show module commands
 from imp_lib.modules import load_module_definition
@@ -23,7 +34,19 @@ MODULE_LOADER_AVAILABLE = True
 # Config file path for reading module config
 CONFIG_FILE = Path("/persistent/config/router.json")
 
+# FIB entry prefixes at start of line in 'show ip fib' / 'show ip6 fib' output
+_FIB_V4_RE = re.compile(r'^(\d+\.\d+\.\d+\.\d+/\d+)(?:\s|$)')
+_FIB_V6_RE = re.compile(r'^([0-9a-fA-F:]+/\d+)(?:\s|$)')
+
+# (monotonic time, size) of the last terminal size query
+_TERM_SIZE: Optional[tuple[float, os.terminal_size]] = None
+_TERM_SIZE_TTL = 1.0
+
+# (config mtime, enabled module names) parsed from router.json
+_SHOW_MODULES_CACHE: Optional[tuple[Optional[int], list[str]]] = None
 
+
+@buffered_stdout()
 def show_live_interfaces() -> None:
     """Show live VPP interface state."""
     print()
@@ -38,16 +61,23 @@ def show_live_interfaces() -> None:
     print()
 
 
+def _term_size() -> os.terminal_size:
+    """Terminal size, re-queried at most once per _TERM_SIZE_TTL seconds."""
+    global _TERM_SIZE
+    now = time.monotonic()
+    if _TERM_SIZE is None or now - _TERM_SIZE[0] > _TERM_SIZE_TTL:
+        _TERM_SIZE = (now, shutil.get_terminal_size((80, 24)))
+    return _TERM_SIZE[1]
+
+
 def pager(content: str, title: str = "") -> None:
     """Display content with paging if it exceeds terminal height."""
-    import pydoc
-
     # Get terminal size
-    term_size = shutil.get_terminal_size((80, 24))
-    lines = content.split('\n')
+    term_size = _term_size()
+    line_count = content.count('\n') + 1
 
     # If content fits in terminal, just print it
-    if len(lines) <= term_size.lines - 5:  # Leave room for prompt
+    if line_count <= term_size.lines - 5:  # Leave room for prompt
         if title:
             print()
             print(f"{Colors.BOLD}{title}{Colors.NC}")
@@ -55,7 +85,8 @@ def pager(content: str, title: str = "") -> None:
         print(content)
         print()
     else:
-        # Use pager for long output
+        # Use pager for long output; pydoc is only needed here
+        import pydoc
         full_content = f"{title}\n{'=' * 70}\n{content}" if title else content
         pydoc.pager(full_content)
 
@@ -114,54 +145,56 @@ def filter_fib_output(output: str, filter_prefix: str, is_ipv6: bool = False) ->
     except ValueError:
         return output  # Invalid filter, return unfiltered
 
-    # Regex to match FIB entry prefixes at start of line
-    if is_ipv6:
-        prefix_pattern = re.compile(r'^([0-9a-fA-F:]+/\d+)(?:\s|$)')
-    else:
-        prefix_pattern = re.compile(r'^(\d+\.\d+\.\d+\.\d+/\d+)(?:\s|$)')
-
-    lines = output.split('\n')
-    result_lines = []
-    current_entry = []
-    current_prefix = None
+    # Compare entries as integer ranges; ipaddress objects are too slow per FIB line
+    family = socket.AF_INET6 if filter_net.version == 6 else socket.AF_INET
+    max_len = filter_net.max_prefixlen
+    all_ones = (1 << max_len) - 1
+    filt_lo = int(filter_net.network_address)
+    filt_hi = int(filter_net.broadcast_address)
+
+    # Bound locally: called once per FIB line
+    match_prefix = (_FIB_V6_RE if is_ipv6 else _FIB_V4_RE).match
+
+    # Stream lines straight into the buffer; an entry's first line decides
+    # whether its continuation lines are kept
+    buf = io.StringIO()
+    write = buf.write
+    in_entries = False
     include_current = False
-    header_lines = []
+    matched = False
 
-    for line in lines:
+    for line in output.splitlines():
         # Check if this line starts a new FIB entry
-        match = prefix_pattern.match(line)
+        match = match_prefix(line)
         if match:
-            # Save previous entry if it matched
-            if include_current and current_entry:
-                result_lines.extend(current_entry)
-
-            # Start new entry
-            current_prefix = match.group(1)
-            current_entry = [line]
+            in_entries = True
 
             # Check if this prefix is within our filter
+            addr, _, plen = match.group(1).partition('/')
             try:
-                entry_net = ipaddress.ip_network(current_prefix, strict=False)
-                # Include if entry is equal to or more specific than filter
-                include_current = (
-                    entry_net.network_address >= filter_net.network_address and
-                    entry_net.broadcast_address <= filter_net.broadcast_address
-                )
-            except ValueError:
+                addr_int = int.from_bytes(socket.inet_pton(family, addr), 'big')
+                plen = int(plen)
+            except (OSError, ValueError):
                 include_current = False
-        elif current_prefix is not None:
-            # Continuation of current entry (indented lines)
-            current_entry.append(line)
-        else:
-            # Header line (before first entry)
-            header_lines.append(line)
-
-    # Don't forget the last entry
-    if include_current and current_entry:
-        result_lines.extend(current_entry)
-
-    if result_lines:
-        return '\n'.join(header_lines + result_lines)
+            else:
+                if plen > max_len:
+                    include_current = False
+                else:
+                    host_mask = all_ones >> plen
+                    entry_lo = addr_int & ~host_mask
+                    # Include if entry is equal to or more specific than filter
+                    include_current = entry_lo >= filt_lo and (entry_lo | host_mask) <= filt_hi
+            if include_current:
+                matched = True
+                write(line)
+                write('\n')
+        elif not in_entries or include_current:
+            # Header line (before first entry) or continuation of a kept entry
+            write(line)
+            write('\n')
+
+    if matched:
+        return buf.getvalue()[:-1]
     else:
         return f"No FIB entries within {filter_prefix}"
 
@@ -194,6 +227,7 @@ def show_live_fib(af: str, prefix: str = None) -> None:
         error(f"Failed to get {af_name} FIB: {output}")
 
 
+@buffered_stdout()
 def show_live_neighbors() -> None:
     """Show ARP/NDP neighbor table."""
     print()
@@ -212,56 +246,112 @@ def show_live_neighbors() -> None:
     print()
 
 
+def _vtysh_parallel(*commands: str) -> list[tuple[int, str]]:
+    """Run vtysh commands concurrently, returning (returncode, stdout) per command."""
+    # Start every netns exec before waiting on any, so wall time is the slowest one
+    procs = []
+    try:
+        for cmd in commands:
+            procs.append(subprocess.Popen(
+                ["ip", "netns", "exec", "dataplane", "vtysh", "-c", cmd],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            ))
+        results = []
+        for proc in procs:
+            stdout, _ = proc.communicate()
+            results.append((proc.returncode, stdout))
+        return results
+    finally:
+        # A later Popen (or Ctrl-C) failing must not leave earlier children running
+        for proc in procs:
+            if proc.returncode is None:
+                proc.kill()
+                proc.communicate()
+
+
+@buffered_stdout()
 def show_live_bgp() -> None:
     """Show BGP neighbor status from FRR."""
     print()
     print(f"{Colors.BOLD}BGP Status (Live){Colors.NC}")
     print("=" * 70)
 
-    print(f"\n{Colors.CYAN}IPv4 Unicast:{Colors.NC}")
-    result = subprocess.run(
-        ["ip", "netns", "exec", "dataplane", "vtysh", "-c", "show ip bgp summary"],
-        capture_output=True, text=True
+    (v4_rc, v4_out), (v6_rc, v6_out) = _vtysh_parallel(
+        "show ip bgp summary", "show bgp ipv6 unicast summary"
     )
-    if result.returncode == 0:
-        print(result.stdout if result.stdout.strip() else "  (no peers)")
+
+    print(f"\n{Colors.CYAN}IPv4 Unicast:{Colors.NC}")
+    if v4_rc == 0:
+        print(v4_out if v4_out.strip() else "  (no peers)")
     else:
         error("Failed to get BGP status (FRR may not be running)")
 
     print(f"\n{Colors.CYAN}IPv6 Unicast:{Colors.NC}")
-    result = subprocess.run(
-        ["ip", "netns", "exec", "dataplane", "vtysh", "-c", "show bgp ipv6 unicast summary"],
-        capture_output=True, text=True
-    )
-    if result.returncode == 0:
-        print(result.stdout if result.stdout.strip() else "  (no peers)")
+    if v6_rc == 0:
+        print(v6_out if v6_out.strip() else "  (no peers)")
     print()
 
 
+@buffered_stdout()
 def show_live_ospf() -> None:
     """Show OSPF neighbor status from FRR."""
     print()
     print(f"{Colors.BOLD}OSPF Status (Live){Colors.NC}")
     print("=" * 70)
 
-    print(f"\n{Colors.CYAN}OSPFv2:{Colors.NC}")
-    result = subprocess.run(
-        ["ip", "netns", "exec", "dataplane", "vtysh", "-c", "show ip ospf neighbor"],
-        capture_output=True, text=True
+    (v2_rc, v2_out), (v3_rc, v3_out) = _vtysh_parallel(
+        "show ip ospf neighbor", "show ipv6 ospf6 neighbor"
     )
-    if result.returncode == 0:
-        print(result.stdout if result.stdout.strip() else "  (no neighbors)")
+
+    print(f"\n{Colors.CYAN}OSPFv2:{Colors.NC}")
+    if v2_rc == 0:
+        print(v2_out if v2_out.strip() else "  (no neighbors)")
 
     print(f"\n{Colors.CYAN}OSPFv3:{Colors.NC}")
-    result = subprocess.run(
-        ["ip", "netns", "exec", "dataplane", "vtysh", "-c", "show ipv6 ospf6 neighbor"],
-        capture_output=True, text=True
-    )
-    if result.returncode == 0:
-        print(result.stdout if result.stdout.strip() else "  (no neighbors)")
+    if v3_rc == 0:
+        print(v3_out if v3_out.strip() else "  (no neighbors)")
     print()
 
 
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of path, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _enabled_show_modules() -> list:
+    """Enabled (name, definition) pairs that define show_commands."""
+    global _SHOW_MODULES_CACHE
+    # Only the router.json parse is cached on its mtime; load_module_definition
+    # revalidates each module YAML by stat, so in-place edits are picked up
+    stamp = _mtime_ns(CONFIG_FILE)
+    if _SHOW_MODULES_CACHE is None or _SHOW_MODULES_CACHE[0] != stamp:
+        names = []
+        if stamp is not None:
+            try:
+                config_data = _json_loads(CONFIG_FILE.read_bytes())
+                names = [
+                    mod["name"] for mod in config_data.get("modules", [])
+                    if mod.get("enabled") and mod.get("name")
+                ]
+            except Exception:
+                pass
+        _SHOW_MODULES_CACHE = (stamp, names)
+
+    enabled_modules = []
+    for mod_name in _SHOW_MODULES_CACHE[1]:
+        try:
+            mod_def = load_module_definition(mod_name)
+            if mod_def.show_commands:
+                enabled_modules.append((mod_name, mod_def))
+        except Exception:
+            pass
+    return enabled_modules
+
+
+@buffered_stdout()
 def show_live_module(args: list[str]) -> None:
     """Show module-specific live state using show_commands from module YAML."""
     if not MODULE_LOADER_AVAILABLE:
@@ -269,22 +359,7 @@ def show_live_module(args: list[str]) -> None:
         return
 
     # Get enabled modules with show_commands
-    enabled_modules = []
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE) as f:
-                config_data = json.load(f)
-            for mod in config_data.get("modules", []):
-                if mod.get("enabled") and mod.get("name"):
-                    mod_name = mod["name"]
-                    try:
-                        mod_def = load_module_definition(mod_name)
-                        if mod_def.show_commands:
-                            enabled_modules.append((mod_name, mod_def))
-                    except Exception:
-                        pass
-        except Exception:
-            pass
+    enabled_modules = _enabled_show_modules()
 
     if not args:
         # List available modules and their commands
@@ -315,7 +390,7 @@ def show_live_module(args: list[str]) -> None:
     if not mod_def:
         error(f"Module '{module_name}' not found or has no show commands")
         if enabled_modules:
-            print(f"Available: {', '.join(n for n, _ in enabled_modules)}")
+            print(f"Available: {', '.join([n for n, _ in enabled_modules])}")
         return
 
     if len(args) < 2:
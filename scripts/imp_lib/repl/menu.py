@@ -5,84 +5,110 @@ This module contains the hierarchical menu structure that defines
 available commands and navigation paths.
 """
 
-
-def build_menu_tree() -> dict:
-    """Build the hierarchical menu structure."""
-    return {
-        "root": {
-            "children": {
-                # Configuration submenu - all config items moved here
-                "config": {
-                    "children": {
-                        "interfaces": {
-                            "children": {
-                                "management": {"commands": ["show", "set-dhcp", "set-static"]},
-                            },
-                            "commands": ["show", "list", "add"],
-                            "dynamic": True,  # Interface names are generated from config
-                        },
-                        "routes": {
-                            "commands": ["list", "add", "delete", "set-default-v4", "set-default-v6"],
-                        },
-                        "loopbacks": {
-                            "commands": ["list", "add", "edit", "delete"],
+# The menu tree is static, so it is built once at import; command lists are
+# tuples so accidental mutation of the shared tree fails loudly
+MENU_TREE = {
+    "root": {
+        "children": {
+            # Configuration submenu - all config items moved here
+            "config": {
+                "children": {
+                    "interfaces": {
+                        "children": {
+                            "management": {"commands": ("show", "set-dhcp", "set-static")},
                         },
-                        "bvi": {
-                            "commands": ["list", "add", "edit", "delete"],
-                        },
-                        "vlan-passthrough": {
-                            "commands": ["list", "add", "delete"],
-                        },
-                        "routing": {
-                            "children": {
-                                "bgp": {
-                                    "commands": ["show", "enable", "disable"],
-                                    "children": {
-                                        "peers": {"commands": ["list", "add", "remove"]},
-                                        "prefixes": {"commands": ["list", "add", "remove"]},
-                                    },
+                        "commands": ("show", "list", "add"),
+                        "dynamic": True,  # Interface names are generated from config
+                    },
+                    "routes": {
+                        "commands": ("list", "add", "delete", "set-default-v4", "set-default-v6"),
+                    },
+                    "loopbacks": {
+                        "commands": ("list", "add", "edit", "delete"),
+                    },
+                    "bvi": {
+                        "commands": ("list", "add", "edit", "delete"),
+                    },
+                    "vlan-passthrough": {
+                        "commands": ("list", "add", "delete"),
+                    },
+                    "routing": {
+                        "children": {
+                            "bgp": {
+                                "commands": ("show", "enable", "disable"),
+                                "children": {
+                                    "peers": {"commands": ("list", "add", "remove")},
+                                    "prefixes": {"commands": ("list", "add", "remove")},
                                 },
-                                "ospf": {"commands": ["show", "enable", "disable", "set"]},
-                                "ospf6": {"commands": ["show", "enable", "disable", "set"]},
                             },
-                            "commands": ["show"],
-                        },
-                        "modules": {
-                            "commands": ["available", "list", "install", "enable", "disable"],
-                            # Module-specific commands are dynamic: config modules <name> <command>
-                        },
-                        "containers": {
-                            "commands": ["show", "set"],
-                        },
-                        "cpu": {
-                            "commands": ["show"],
+                            "ospf": {"commands": ("show", "enable", "disable", "set")},
+                            "ospf6": {"commands": ("show", "enable", "disable", "set")},
                         },
+                        "commands": ("show",),
                     },
-                    "commands": ["show"],
-                },
-                # Operational commands remain at root
-                "shell": {
-                    "children": {
-                        "routing": {"commands": []},
-                        "core": {"commands": []},
-                        # Module shells are dynamic - added by completer based on running modules
+                    "modules": {
+                        "commands": ("available", "list", "install", "enable", "disable"),
+                        # Module-specific commands are dynamic: config modules <name> <command>
+                    },
+                    "containers": {
+                        "commands": ("show", "set"),
+                    },
+                    "cpu": {
+                        "commands": ("show",),
                     },
-                    "commands": [],
-                    "dynamic": True,  # Shell has dynamic children (running modules)
-                },
-                "capture": {
-                    "commands": ["start", "stop", "status", "files", "analyze", "export", "delete"],
-                },
-                "trace": {
-                    "commands": ["start", "stop", "status", "show", "clear"],
-                },
-                "snapshot": {
-                    "commands": ["list", "create", "delete", "export", "import", "rollback"],
                 },
-                "agent": {
-                    "commands": [],
+                "commands": ("show",),
+            },
+            # Operational commands remain at root
+            "shell": {
+                "children": {
+                    "routing": {"commands": ()},
+                    "core": {"commands": ()},
+                    # Module shells are dynamic - added by completer based on running modules
                 },
+                "commands": (),
+                "dynamic": True,  # Shell has dynamic children (running modules)
+            },
+            "capture": {
+                "commands": ("start", "stop", "status", "files", "analyze", "export", "delete"),
             },
-            "commands": ["show", "status"],
-        }
+            "trace": {
+                "commands": ("start", "stop", "status", "show", "clear"),
+            },
+            "snapshot": {
+                "commands": ("list", "create", "delete", "export", "import", "rollback"),
+            },
+            "agent": {
+                "commands": (),
+            },
+        },
+        "commands": ("show", "status"),
     }
+}
+
+
+# id(menu tree) -> (menu tree, {path tuple: node}); the tree is kept so its id stays unique
+_FLAT_MENUS: dict[int, tuple[dict, dict[tuple[str, ...], dict]]] = {}
+
+
+def build_menu_tree() -> dict:
+    """Return the hierarchical menu structure."""
+    return MENU_TREE
+
+
+def flatten_menu_tree(menus: dict) -> dict[tuple[str, ...], dict]:
+    """Map every static menu path to its node, walking the tree only once."""
+    cached = _FLAT_MENUS.get(id(menus))
+    if cached is not None:
+        return cached[1]
+
+    flat = {}
+
+    def walk(path: tuple[str, ...], node: dict) -> None:
+        flat[path] = node
+        for name, child in node.get("children", {}).items():
+            walk(path + (name,), child)
+
+    walk((), menus["root"])
+    _FLAT_MENUS[id(menus)] = (menus, flat)
+    return flat
@@ -5,6 +5,33 @@ This module handles menu navigation within the hierarchical menu system.
 """
 
 from .context import MenuContext
+from .menu import flatten_menu_tree
+
+
+def _match_interface(ctx: MenuContext, target: str) -> bool:
+    return bool(ctx.config.get_interface(target))
+
+
+def _match_subinterfaces(ctx: MenuContext, target: str) -> bool:
+    return target == "subinterfaces" and bool(ctx.config.get_interface(ctx.path[2]))
+
+
+def _match_module(ctx: MenuContext, target: str) -> bool:
+    return bool(ctx.config.get_module(target))
+
+
+def _match_module_subpath(ctx: MenuContext, target: str) -> bool:
+    # Allow any navigation within a module - the command handler will validate
+    return True
+
+
+# (path prefix, segments after the prefix or None for one or more, matcher), tried in order
+DYNAMIC_RULES = (
+    (("config", "interfaces"), 0, _match_interface),        # config interfaces <name>
+    (("config", "interfaces"), 1, _match_subinterfaces),    # config interfaces <name> subinterfaces
+    (("config", "modules"), 0, _match_module),              # config modules <name>
+    (("config", "modules"), None, _match_module_subpath),   # config modules <name> <subpath>...
+)
 
 
 def navigate(ctx: MenuContext, target: str, menus: dict) -> bool:
@@ -19,42 +46,25 @@ def navigate(ctx: MenuContext, target: str, menus: dict) -> bool:
     Returns:
         True if navigation succeeded, False otherwise
     """
-    # Get current menu
-    menu = menus.get("root")
-    for segment in ctx.path:
-        if menu and "children" in menu:
-            menu = menu["children"].get(segment, {})
+    # Get current menu (None for dynamic paths outside the static tree)
+    menu = flatten_menu_tree(menus).get(ctx.path)
 
     # Check if target is a valid child
     if menu and "children" in menu and target in menu["children"]:
-        ctx.path.append(target)
+        ctx.path += (target,)
         return True
 
-    # Dynamic interface navigation: config interfaces <name>
-    if ctx.path == ["config", "interfaces"] and ctx.config:
-        if any(i.name == target for i in ctx.config.interfaces):
-            ctx.path.append(target)
-            return True
-
-    # Subinterfaces on a dynamic interface
-    if len(ctx.path) == 3 and ctx.path[:2] == ["config", "interfaces"] and ctx.config:
-        iface_name = ctx.path[2]
-        if any(i.name == iface_name for i in ctx.config.interfaces):
-            if target == "subinterfaces":
-                ctx.path.append(target)
+    # Dynamic segments come from the loaded config
+    if ctx.config:
+        path = ctx.path
+        for prefix, extra, matcher in DYNAMIC_RULES:
+            depth = len(prefix)
+            if path[:depth] != prefix:
+                continue
+            if (len(path) <= depth) if extra is None else (len(path) != depth + extra):
+                continue
+            if matcher(ctx, target):
+                ctx.path += (target,)
                 return True
 
-    # Dynamic module navigation: config modules <name>
-    if ctx.path == ["config", "modules"] and ctx.config:
-        for m in ctx.config.modules:
-            if m.get('name') == target:
-                ctx.path.append(target)
-                return True
-
-    # Subpaths within a module (e.g., config modules nat mappings)
-    if len(ctx.path) >= 3 and ctx.path[:2] == ["config", "modules"] and ctx.config:
-        # Allow any navigation within a module - the command handler will validate
-        ctx.path.append(target)
-        return True
-
     return False
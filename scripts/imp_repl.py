@@ -6,13 +6,14 @@ This module provides a hierarchical menu-driven interface for managing
 router configuration. Changes are staged until explicitly applied.
 """
 
+import copy
+import importlib.util
 import ipaddress
-import json
 import os
 import re
 import subprocess
 import sys
-from dataclasses import asdict
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Callable, Any
 
@@ -33,7 +34,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 sys.path.insert(0, '/usr/local/lib/python3/dist-packages')
 
 # Import shared utilities from imp_lib
-from imp_lib.common import Colors, log, warn, error, info
+from imp_lib.common import Colors, use_color, set_color, log, warn, error, info
 from imp_lib.common.vpp import get_vpp_socket, get_available_vpp_instances, vpp_exec
 
 # Import display functions from imp_lib
@@ -62,6 +63,7 @@ from imp_lib.repl.display import (
     show_live_module as _show_live_module,
     filter_fib_output as _filter_fib_output,
     pager as _pager,
+    buffered_stdout,
 )
 
 # Import menu system from imp_lib
@@ -105,6 +107,7 @@ from imp_lib.repl.commands import (
     cmd_snapshot_list, cmd_snapshot_create, cmd_snapshot_delete,
     cmd_snapshot_export, cmd_snapshot_import, cmd_snapshot_rollback,
 )
+from imp_lib.repl.commands.crud import _get_parent_interface
 # Import configuration dataclasses from imp_lib.config
 from imp_lib.config import (
     RouterConfig, Interface, InterfaceAddress, Route, ManagementInterface,
@@ -116,12 +119,19 @@ from imp_lib.config import (
     TEMPLATE_DIR, CONFIG_FILE, GENERATED_DIR
 )
 
-# Import template rendering from configure_router (still there for apply command)
-try:
-    from configure_router import render_templates, apply_configs
-    CONFIG_AVAILABLE = True
-except ImportError:
-    CONFIG_AVAILABLE = False
+# Template rendering lives in configure_router (still there for apply command).
+# It pulls in jinja2, so only probe for it here and import on first apply.
+CONFIG_AVAILABLE = importlib.util.find_spec("configure_router") is not None
+
+
+def _get_template_renderer():
+    """Import render_templates/apply_configs from configure_router on first use."""
+    try:
+        from configure_router import render_templates, apply_configs
+    except (ImportError, SystemExit):
+        # configure_router exits if jinja2 is missing
+        return None, None
+    return render_templates, apply_configs
 
 # Import module system from imp_lib
 from imp_lib.modules import (
@@ -142,62 +152,87 @@ MODULE_LOADER_AVAILABLE = True
 # Generic Module Command Executor
 # =============================================================================
 
-def validate_param_value(value: str, param_type: str) -> tuple[bool, str]:
-    """Validate a parameter value against its type. Returns (valid, error_msg)."""
-    import ipaddress
+# The ipaddress validators are pure, so prompt retries on the same input reuse the result
+@lru_cache(maxsize=256)
+def _validate_ipv4_cidr(value: str) -> tuple[bool, str]:
+    try:
+        ipaddress.IPv4Network(value, strict=False)
+        return True, ""
+    except (ipaddress.AddressValueError, ipaddress.NetmaskValueError, ValueError):
+        return False, "Invalid IPv4 CIDR (e.g., 10.0.0.0/24)"
 
-    if param_type == 'ipv4_cidr':
-        try:
-            ipaddress.IPv4Network(value, strict=False)
-            return True, ""
-        except (ipaddress.AddressValueError, ipaddress.NetmaskValueError, ValueError):
-            return False, "Invalid IPv4 CIDR (e.g., 10.0.0.0/24)"
 
-    elif param_type == 'ipv6_cidr':
-        try:
-            ipaddress.IPv6Network(value, strict=False)
-            return True, ""
-        except (ipaddress.AddressValueError, ipaddress.NetmaskValueError, ValueError):
-            return False, "Invalid IPv6 CIDR (e.g., 2001:db8::/32)"
+@lru_cache(maxsize=256)
+def _validate_ipv6_cidr(value: str) -> tuple[bool, str]:
+    try:
+        ipaddress.IPv6Network(value, strict=False)
+        return True, ""
+    except (ipaddress.AddressValueError, ipaddress.NetmaskValueError, ValueError):
+        return False, "Invalid IPv6 CIDR (e.g., 2001:db8::/32)"
 
-    elif param_type == 'ipv4':
-        try:
-            ipaddress.IPv4Address(value)
-            return True, ""
-        except ipaddress.AddressValueError:
-            return False, "Invalid IPv4 address"
 
-    elif param_type == 'ipv6':
-        try:
-            ipaddress.IPv6Address(value)
-            return True, ""
-        except ipaddress.AddressValueError:
-            return False, "Invalid IPv6 address"
+@lru_cache(maxsize=256)
+def _validate_ipv4(value: str) -> tuple[bool, str]:
+    try:
+        ipaddress.IPv4Address(value)
+        return True, ""
+    except ipaddress.AddressValueError:
+        return False, "Invalid IPv4 address"
 
-    elif param_type == 'integer':
-        try:
-            int(value)
-            return True, ""
-        except ValueError:
-            return False, "Must be an integer"
 
-    elif param_type == 'boolean':
-        if value.lower() in ('true', 'false', 'yes', 'no', '1', '0'):
-            return True, ""
-        return False, "Must be true/false or yes/no"
+@lru_cache(maxsize=256)
+def _validate_ipv6(value: str) -> tuple[bool, str]:
+    try:
+        ipaddress.IPv6Address(value)
+        return True, ""
+    except ipaddress.AddressValueError:
+        return False, "Invalid IPv6 address"
+
+
+def _validate_integer(value: str) -> tuple[bool, str]:
+    try:
+        int(value)
+        return True, ""
+    except ValueError:
+        return False, "Must be an integer"
+
 
-    # string and other types - accept anything
+def _validate_boolean(value: str) -> tuple[bool, str]:
+    if value.lower() in ('true', 'false', 'yes', 'no', '1', '0'):
+        return True, ""
+    return False, "Must be true/false or yes/no"
+
+
+def _validate_any(value: str) -> tuple[bool, str]:
     return True, ""
 
 
+# Per-type validators; string and other types accept anything
+_PARAM_VALIDATORS: dict[str, Callable[[str], tuple[bool, str]]] = {
+    'ipv4_cidr': _validate_ipv4_cidr,
+    'ipv6_cidr': _validate_ipv6_cidr,
+    'ipv4': _validate_ipv4,
+    'ipv6': _validate_ipv6,
+    'integer': _validate_integer,
+    'boolean': _validate_boolean,
+}
+
+# Per-type converters; all other types remain strings
+_PARAM_CONVERTERS: dict[str, Callable[[str], Any]] = {
+    'integer': int,
+    'boolean': lambda value: value.lower() in ('true', 'yes', '1'),
+}
+
+
+def validate_param_value(value: str, param_type: str) -> tuple[bool, str]:
+    """Validate a parameter value against its type. Returns (valid, error_msg)."""
+    return _PARAM_VALIDATORS.get(param_type, _validate_any)(value)
+
+
 def convert_param_value(value: str, param_type: str):
     """Convert string value to appropriate Python type."""
-    if param_type == 'integer':
-        return int(value)
-    elif param_type == 'boolean':
-        return value.lower() in ('true', 'yes', '1')
-    # All others remain strings
-    return value
+    converter = _PARAM_CONVERTERS.get(param_type)
+    return converter(value) if converter else value
 
 
 def execute_module_command(ctx, module_name: str, cmd: 'ModuleCommand') -> None:
@@ -215,9 +250,7 @@ def execute_module_command(ctx, module_name: str, cmd: 'ModuleCommand') -> None:
             'enabled': True,
             'config': {}
         }
-        if not hasattr(ctx.config, 'modules'):
-            ctx.config.modules = []
-        ctx.config.modules.append(module_dict)
+        ctx.config.add_module(module_dict)
 
     if not module_dict.get('enabled'):
         module_dict['enabled'] = True
@@ -292,10 +325,9 @@ def _exec_array_append(ctx, mod_cfg: dict, cmd: 'ModuleCommand') -> None:
 
         # Check if all key fields are present in item
         if all(k in item for k in key_fields):
-            def matches_key(existing):
-                return all(existing.get(k) == item.get(k) for k in key_fields)
-
-            if any(matches_key(existing) for existing in target_array):
+            # Compare key lists directly; no per-entry closure call or nested all()
+            new_key = [item[k] for k in key_fields]
+            if any([existing.get(k) for k in key_fields] == new_key for existing in target_array):
                 key_display = ", ".join(f"{k}={item[k]}" for k in key_fields)
                 print(f"{Colors.RED}[!] Entry with {key_display} already exists{Colors.NC}")
                 return
@@ -311,6 +343,16 @@ def _exec_array_append(ctx, mod_cfg: dict, cmd: 'ModuleCommand') -> None:
     print(f"{Colors.GREEN}[+] Added: {display}{Colors.NC}")
 
 
+def _format_item(cmd: 'ModuleCommand', item: dict) -> str:
+    """Render an array item with the command's format string, falling back to str()."""
+    if cmd.format:
+        try:
+            return cmd.format.format_map(item)
+        except KeyError:
+            pass
+    return str(item)
+
+
 def _exec_array_remove(ctx, mod_cfg: dict, cmd: 'ModuleCommand') -> None:
     """Execute array_remove action - remove item from array."""
     if cmd.target not in mod_cfg or not mod_cfg[cmd.target]:
@@ -320,18 +362,11 @@ def _exec_array_remove(ctx, mod_cfg: dict, cmd: 'ModuleCommand') -> None:
     target_array = mod_cfg[cmd.target]
     key_field = cmd.key or 'name'
 
-    print()
-    print(f"Current {cmd.target}:")
-    for i, item in enumerate(target_array, 1):
-        if cmd.format:
-            try:
-                display = cmd.format.format(**item)
-            except KeyError:
-                display = str(item)
-        else:
-            display = str(item)
-        print(f"  {i}. {display}")
-    print()
+    # Format each entry once; the deleted entry's text is reused below
+    displays = [_format_item(cmd, item) for item in target_array]
+
+    listing = "\n".join([f"  {i}. {display}" for i, display in enumerate(displays, 1)])
+    print(f"\nCurrent {cmd.target}:\n{listing}\n")
 
     choice = input("Delete which entry (number or press Enter to cancel): ").strip()
     if not choice:
@@ -346,17 +381,10 @@ def _exec_array_remove(ctx, mod_cfg: dict, cmd: 'ModuleCommand') -> None:
         print(f"{Colors.RED}[!] Invalid number{Colors.NC}")
         return
 
-    removed = target_array.pop(idx)
+    target_array.pop(idx)
     ctx.dirty = True
 
-    if cmd.format:
-        try:
-            display = cmd.format.format(**removed)
-        except KeyError:
-            display = str(removed)
-    else:
-        display = str(removed)
-    print(f"{Colors.GREEN}[+] Deleted: {display}{Colors.NC}")
+    print(f"{Colors.GREEN}[+] Deleted: {displays[idx]}{Colors.NC}")
 
 
 def _exec_array_list(mod_cfg: dict, cmd: 'ModuleCommand') -> None:
@@ -365,16 +393,8 @@ def _exec_array_list(mod_cfg: dict, cmd: 'ModuleCommand') -> None:
         print(f"  (none configured)")
         return
 
-    target_array = mod_cfg[cmd.target]
-    for item in target_array:
-        if cmd.format:
-            try:
-                display = cmd.format.format(**item)
-            except KeyError:
-                display = str(item)
-        else:
-            display = str(item)
-        print(f"  {display}")
+    # One write for the whole listing
+    print("\n".join([f"  {_format_item(cmd, item)}" for item in mod_cfg[cmd.target]]))
 
 
 def _exec_set_value(ctx, mod_cfg: dict, cmd: 'ModuleCommand') -> None:
@@ -460,45 +480,74 @@ IMP_STYLE = Style.from_dict({
 # Command Handlers
 # =============================================================================
 
+@lru_cache(maxsize=16)
+def _help_heading(title: str, color: bool) -> str:
+    """cmd_help section heading, formatted once per title and color state."""
+    if not color:
+        return f"  {title}:"
+    return f"  {Colors.CYAN}{title}:{Colors.NC}"
+
+
+# (menu tree id, path) -> (node, sorted submenu names) for cmd_help; the menu tree is static.
+# Sorted names live here rather than in the shared menu tree's nodes.
+_HELP_MENU_CACHE: dict[tuple[int, tuple[str, ...]], tuple[dict, tuple[str, ...]]] = {}
+
+
+def _help_menu_node(menus: dict, path: tuple[str, ...]) -> tuple[dict, tuple[str, ...]]:
+    """Resolve cmd_help's menu node for path and its sorted submenu names, once per path."""
+    key = (id(menus), path)
+    cached = _HELP_MENU_CACHE.get(key)
+    if cached is None:
+        # Segments below a node without children (e.g. module names) keep that node
+        menu = menus.get("root")
+        for segment in path:
+            if menu and "children" in menu:
+                menu = menu["children"].get(segment, {})
+        submenus = tuple(sorted(menu["children"])) if menu and "children" in menu else ()
+        cached = _HELP_MENU_CACHE[key] = (menu, submenus)
+    return cached
+
+
+@lru_cache(maxsize=16)
+def _help_header(at_root: bool, in_config: bool, dirty: bool, color: bool) -> str:
+    """Static top of cmd_help (title, navigation, operations), built once per variant."""
+    title = f"{Colors.BOLD}Available Commands:{Colors.NC}" if color else "Available Commands:"
+    lines = ["", title, "", _help_heading("Navigation", color), "    help, ?         Show this help"]
+    if not at_root:  # Only show when not at root
+        lines.append("    back, ..        Go up one level")
+        lines.append("    home, /         Return to root menu")
+    lines += ["    exit, quit      Exit the REPL", "", _help_heading("Operations", color)]
+    if not in_config:
+        lines.append("    show            Display live state (show interfaces, routes, bgp, etc.)")
+        lines.append("    show config     Display staged configuration")
+    else:
+        lines.append("    show            Display configuration at current level")
+    lines.append("    status          Show staged vs applied status")
+    if dirty:
+        lines.append("    apply           Save and regenerate config files")
+    # apply is a no-op when the config matches the last apply of this session
+    lines.append("    apply force     Re-apply even if unchanged since this session's last apply")
+    lines.append("    reload          Reload from JSON (discard changes)")
+    lines.append("    agent           Enter LLM-powered agent mode (Ollama)")
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+@buffered_stdout()
 def cmd_help(ctx: MenuContext, args: list[str], menus: dict) -> None:
     """Show help for current menu."""
-    print()
-    print(f"{Colors.BOLD}Available Commands:{Colors.NC}")
-    print()
-
-    # Navigation commands
-    print(f"  {Colors.CYAN}Navigation:{Colors.NC}")
-    print("    help, ?         Show this help")
-    if ctx.path:  # Only show when not at root
-        print("    back, ..        Go up one level")
-        print("    home, /         Return to root menu")
-    print("    exit, quit      Exit the REPL")
-    print()
-
-    # Operational commands
-    print(f"  {Colors.CYAN}Operations:{Colors.NC}")
-    if not ctx.path or ctx.path[0] != "config":
-        print("    show            Display live state (show interfaces, routes, bgp, etc.)")
-        print("    show config     Display staged configuration")
-    else:
-        print("    show            Display configuration at current level")
-    print("    status          Show staged vs applied status")
-    if ctx.dirty:
-        print("    apply           Save and regenerate config files")
-    print("    reload          Reload from JSON (discard changes)")
-    print("    agent           Enter LLM-powered agent mode (Ollama)")
-    print()
+    # Navigation and operational commands
+    color = Colors.NC != ""  # Decided once by buffered_stdout for this output
+    in_config = bool(ctx.path) and ctx.path[0] == "config"
+    sys.stdout.write(_help_header(not ctx.path, in_config, bool(ctx.dirty), color))
 
     # Get current menu
-    menu = menus.get("root")
-    for segment in ctx.path:
-        if menu and "children" in menu:
-            menu = menu["children"].get(segment, {})
+    menu, submenus = _help_menu_node(menus, ctx.path)
 
     # Show submenus
     if menu and "children" in menu:
-        print(f"  {Colors.CYAN}Submenus:{Colors.NC}")
-        for name in sorted(menu["children"].keys()):
+        print(_help_heading("Submenus", color))
+        for name in submenus:
             print(f"    {name}")
         print()
 
@@ -506,14 +555,14 @@ def cmd_help(ctx: MenuContext, args: list[str], menus: dict) -> None:
     if menu and "commands" in menu:
         cmds = [c for c in menu["commands"] if c not in ["show"]]
         if cmds:
-            print(f"  {Colors.CYAN}Actions:{Colors.NC}")
+            print(_help_heading("Actions", color))
             for cmd in cmds:
                 print(f"    {cmd}")
             print()
 
     # Show module-specific commands when inside a module
     # Path like ["config", "modules", "nat"] or ["config", "modules", "nat", "mappings"]
-    if len(ctx.path) >= 3 and ctx.path[:2] == ["config", "modules"]:
+    if len(ctx.path) >= 3 and ctx.path[:2] == ("config", "modules"):
         module_name = ctx.path[2]
         module_cmds = get_module_commands(module_name)
         if module_cmds:
@@ -541,18 +590,91 @@ def cmd_help(ctx: MenuContext, args: list[str], menus: dict) -> None:
                         direct_cmds.append((cmd.path, cmd.description))
 
             if top_level:
-                print(f"  {Colors.CYAN}Module Submenus:{Colors.NC}")
+                print(_help_heading("Module Submenus", color))
                 for name in sorted(top_level):
                     print(f"    {name}")
                 print()
 
             if direct_cmds:
-                print(f"  {Colors.CYAN}Module Commands:{Colors.NC}")
+                print(_help_heading("Module Commands", color))
                 for cmd_name, desc in direct_cmds:
                     print(f"    {cmd_name:16} {desc}")
                 print()
 
 
+def _show_root_summary(config) -> None:
+    """Show the root-level configuration summary."""
+    print(f"{Colors.BOLD}Configuration Summary{Colors.NC}")
+    print("=" * 50)
+    print()
+    print(f"  Hostname:    {config.hostname}")
+
+    if config.management:
+        print(f"  Management:  {config.management.iface} ({config.management.mode})")
+
+    if config.interfaces:
+        for iface in config.interfaces:
+            ipv4_str = ", ".join([f"{a.address}/{a.prefix}" for a in iface.ipv4]) if iface.ipv4 else "none"
+            print(f"  {iface.name}: {iface.iface} -> {ipv4_str}")
+            if iface.subinterfaces:
+                print(f"    + {len(iface.subinterfaces)} sub-interface(s)")
+
+    if config.routes:
+        # One pass for both defaults, stopping once each is found
+        default_v4 = default_v6 = None
+        for r in config.routes:
+            if r.destination == "0.0.0.0/0":
+                if default_v4 is None:
+                    default_v4 = r
+            elif r.destination == "::/0":
+                if default_v6 is None:
+                    default_v6 = r
+            else:
+                continue
+            if default_v4 is not None and default_v6 is not None:
+                break
+        print(f"  Default v4:  {default_v4.via if default_v4 else 'none'}")
+        print(f"  Default v6:  {default_v6.via if default_v6 else 'none'}")
+
+    if config.bgp.enabled:
+        peer_count = len(config.bgp.peers)
+        print(f"  BGP:         AS {config.bgp.asn}, {peer_count} peer{'s' if peer_count != 1 else ''}")
+    else:
+        print(f"  BGP:         Disabled")
+
+    nat_cfg = get_nat_config(config)
+    if nat_cfg:
+        print(f"  NAT prefix:  {nat_cfg.get('bgp_prefix', 'not set')}")
+        print(f"  NAT mappings: {len(nat_cfg.get('mappings', []))}")
+    else:
+        print(f"  NAT:         Not configured (use 'config modules enable nat')")
+    print(f"  Loopbacks:   {len(config.loopbacks)}")
+    print(f"  BVI domains: {len(config.bvi_domains)}")
+    print(f"  VLAN pass:   {len(config.vlan_passthrough)}")
+    print()
+
+
+# Static show paths (with any leading "config" stripped) -> handler(config)
+_SHOW_DISPATCH: dict[tuple[str, ...], Callable[[Any], None]] = {
+    (): _show_root_summary,
+    ("interfaces",): _show_interfaces,
+    ("interfaces", "management"): _show_management,
+    ("routes",): _show_routes,
+    ("loopbacks",): _show_loopbacks,
+    ("bvi",): _show_bvi,
+    ("vlan-passthrough",): _show_vlan_passthrough,
+    ("routing",): _show_routing,
+    ("routing", "bgp"): _show_bgp,
+    ("routing", "bgp", "peers"): lambda config: cmd_bgp_peers_list(MenuContext(config=config), []),
+    ("routing", "bgp", "prefixes"): lambda config: cmd_bgp_prefixes_list(MenuContext(config=config), []),
+    ("routing", "ospf"): _show_ospf,
+    ("routing", "ospf6"): _show_ospf6,
+    ("containers",): _show_containers,
+    ("cpu",): _show_cpu,
+}
+
+
+@buffered_stdout()
 def cmd_show(ctx: MenuContext, args: list[str]) -> None:
     """Show configuration at current level."""
     if not ctx.config:
@@ -565,122 +687,66 @@ def cmd_show(ctx: MenuContext, args: list[str]) -> None:
 
     print()
 
-    if not path:
-        # Root level - show summary
-        print(f"{Colors.BOLD}Configuration Summary{Colors.NC}")
-        print("=" * 50)
-        print()
-        print(f"  Hostname:    {config.hostname}")
-
-        if config.management:
-            print(f"  Management:  {config.management.iface} ({config.management.mode})")
-
-        if config.interfaces:
-            for iface in config.interfaces:
-                ipv4_str = ", ".join(f"{a.address}/{a.prefix}" for a in iface.ipv4) if iface.ipv4 else "none"
-                print(f"  {iface.name}: {iface.iface} -> {ipv4_str}")
-                if iface.subinterfaces:
-                    print(f"    + {len(iface.subinterfaces)} sub-interface(s)")
-
-        if config.routes:
-            default_v4 = next((r for r in config.routes if r.destination == "0.0.0.0/0"), None)
-            default_v6 = next((r for r in config.routes if r.destination == "::/0"), None)
-            print(f"  Default v4:  {default_v4.via if default_v4 else 'none'}")
-            print(f"  Default v6:  {default_v6.via if default_v6 else 'none'}")
-
-        if config.bgp.enabled:
-            peer_count = len(config.bgp.peers)
-            print(f"  BGP:         AS {config.bgp.asn}, {peer_count} peer{'s' if peer_count != 1 else ''}")
-        else:
-            print(f"  BGP:         Disabled")
-
-        nat_cfg = get_nat_config(config)
-        if nat_cfg:
-            print(f"  NAT prefix:  {nat_cfg.get('bgp_prefix', 'not set')}")
-            print(f"  NAT mappings: {len(nat_cfg.get('mappings', []))}")
-        else:
-            print(f"  NAT:         Not configured (use 'config modules enable nat')")
-        print(f"  Loopbacks:   {len(config.loopbacks)}")
-        print(f"  BVI domains: {len(config.bvi_domains)}")
-        print(f"  VLAN pass:   {len(config.vlan_passthrough)}")
-        print()
+    handler = _SHOW_DISPATCH.get(path)
+    if handler:
+        handler(config)
 
-    elif path == ["interfaces"]:
-        _show_interfaces(config)
-
-    elif path == ["interfaces", "management"]:
-        _show_management(config)
-
-    elif len(path) >= 2 and path[0] == "interfaces" and path[1] not in ("management",):
+    elif len(path) >= 2 and path[0] == "interfaces" and path[1] != "management":
         # Dynamic interface handling
         iface_name = path[1]
-        iface = next((i for i in config.interfaces if i.name == iface_name), None)
+        iface = config.get_interface(iface_name)
         if iface:
             if len(path) == 2:
                 _show_interface_detail(iface)
             elif len(path) >= 3 and path[2] == "subinterfaces":
                 _show_subinterfaces(iface.subinterfaces, iface.name)
 
-    elif path == ["routes"]:
-        _show_routes(config)
-
-    elif path == ["loopbacks"]:
-        _show_loopbacks(config)
-
-    elif path == ["bvi"]:
-        _show_bvi(config)
-
-    elif path == ["vlan-passthrough"]:
-        _show_vlan_passthrough(config)
-
-    elif path == ["routing"]:
-        _show_routing(config)
-
-    elif path == ["routing", "bgp"]:
-        _show_bgp(config)
-
-    elif path == ["routing", "bgp", "peers"]:
-        cmd_bgp_peers_list(MenuContext(config=config), [])
-
-    elif path == ["routing", "bgp", "prefixes"]:
-        cmd_bgp_prefixes_list(MenuContext(config=config), [])
+    else:
+        warn(f"No show handler for path: {'.'.join(path)}")
 
-    elif path == ["routing", "ospf"]:
-        _show_ospf(config)
 
-    elif path == ["routing", "ospf6"]:
-        _show_ospf6(config)
+@buffered_stdout()
+def _print_live_categories() -> None:
+    """List the 'show' live state categories."""
+    print()
+    print(f"{Colors.BOLD}Live State Categories:{Colors.NC}")
+    print("  interfaces          - VPP interface state and counters")
+    print("  ip route [prefix]   - IPv4 routing table (FRR)")
+    print("  ipv6 route [prefix] - IPv6 routing table (FRR)")
+    print("  ip fib [prefix]     - IPv4 forwarding table (VPP)")
+    print("  ipv6 fib [prefix]   - IPv6 forwarding table (VPP)")
+    print("  neighbors           - ARP/NDP neighbor table")
+    print("  bgp                 - BGP neighbor status")
+    print("  ospf                - OSPF neighbor status")
+    print("  module <name> <cmd> - Module-specific commands")
+    print()
+    print("Prefix filter shows routes within the given prefix, e.g.:")
+    print("  show ip route 10.0.0.0/8")
+    print()
+    print("Use 'show config' to view staged configuration")
 
-    elif path == ["containers"]:
-        _show_containers(config)
 
-    elif path == ["cpu"]:
-        _show_cpu(config)
+# show <target> ... -> handler(args); "ip"/"ipv6" take a second word from _LIVE_AF_VIEWS
+_LIVE_TARGETS: dict[str, Callable[[list[str]], None]] = {
+    "interfaces": lambda args: _show_live_interfaces(),
+    "neighbors": lambda args: _show_live_neighbors(),
+    "bgp": lambda args: _show_live_bgp(),
+    "ospf": lambda args: _show_live_ospf(),
+    "module": lambda args: _show_live_module(args[1:]),
+}
 
-    else:
-        warn(f"No show handler for path: {'.'.join(path)}")
+# show ip|ipv6 <view> [prefix] -> view(af, prefix)
+_LIVE_AF_VIEWS: dict[str, Callable[[str, Optional[str]], None]] = {
+    "route": _show_live_route,
+    "fib": _show_live_fib,
+}
 
 
 def cmd_show_live(ctx: MenuContext, args: list[str]) -> None:
     """Show live operational state from VPP/FRR."""
     if not args:
         # Show available categories
-        print()
-        print(f"{Colors.BOLD}Live State Categories:{Colors.NC}")
-        print("  interfaces          - VPP interface state and counters")
-        print("  ip route [prefix]   - IPv4 routing table (FRR)")
-        print("  ipv6 route [prefix] - IPv6 routing table (FRR)")
-        print("  ip fib [prefix]     - IPv4 forwarding table (VPP)")
-        print("  ipv6 fib [prefix]   - IPv6 forwarding table (VPP)")
-        print("  neighbors           - ARP/NDP neighbor table")
-        print("  bgp                 - BGP neighbor status")
-        print("  ospf                - OSPF neighbor status")
-        print("  module <name> <cmd> - Module-specific commands")
-        print()
-        print("Prefix filter shows routes within the given prefix, e.g.:")
-        print("  show ip route 10.0.0.0/8")
-        print()
-        print("Use 'show config' to view staged configuration")
+        _print_live_categories()
         return
 
     target = args[0].lower()
@@ -689,46 +755,28 @@ def cmd_show_live(ctx: MenuContext, args: list[str]) -> None:
         # Delegate to config show
         if len(args) > 1:
             # Build path from remaining args for config show
-            temp_ctx = MenuContext(config=ctx.config, path=["config"] + args[1:])
+            temp_ctx = MenuContext(config=ctx.config, path=("config", *args[1:]))
             cmd_show(temp_ctx, [])
         else:
-            temp_ctx = MenuContext(config=ctx.config, path=[])
+            temp_ctx = MenuContext(config=ctx.config, path=())
             cmd_show(temp_ctx, [])
         return
 
-    if target == "interfaces":
-        _show_live_interfaces()
-    elif target == "ip" and len(args) > 1:
-        subtarget = args[1].lower()
-        prefix_filter = args[2] if len(args) > 2 else None
-        if subtarget == "route":
-            _show_live_route("ip", prefix_filter)
-        elif subtarget == "fib":
-            _show_live_fib("ip", prefix_filter)
-        else:
-            warn(f"Unknown: show ip {subtarget}")
-            print("Use: show ip route [prefix], show ip fib [prefix]")
-    elif target == "ipv6" and len(args) > 1:
+    handler = _LIVE_TARGETS.get(target)
+    if handler:
+        handler(args)
+    elif target in ("ip", "ipv6"):
+        if len(args) < 2:
+            warn(f"Incomplete command: show {target}")
+            print(f"Use: show {target} route [prefix], show {target} fib [prefix]")
+            return
         subtarget = args[1].lower()
-        prefix_filter = args[2] if len(args) > 2 else None
-        if subtarget == "route":
-            _show_live_route("ipv6", prefix_filter)
-        elif subtarget == "fib":
-            _show_live_fib("ipv6", prefix_filter)
+        view = _LIVE_AF_VIEWS.get(subtarget)
+        if view:
+            view(target, args[2] if len(args) > 2 else None)
         else:
-            warn(f"Unknown: show ipv6 {subtarget}")
-            print("Use: show ipv6 route [prefix], show ipv6 fib [prefix]")
-    elif target in ("ip", "ipv6"):
-        warn(f"Incomplete command: show {target}")
-        print(f"Use: show {target} route [prefix], show {target} fib [prefix]")
-    elif target == "neighbors":
-        _show_live_neighbors()
-    elif target == "bgp":
-        _show_live_bgp()
-    elif target == "ospf":
-        _show_live_ospf()
-    elif target == "module":
-        _show_live_module(args[1:])
+            warn(f"Unknown: show {target} {subtarget}")
+            print(f"Use: show {target} route [prefix], show {target} fib [prefix]")
     else:
         warn(f"Unknown show target: {target}")
         print("Use 'show' for available options")
@@ -777,23 +825,31 @@ def cmd_apply(ctx: MenuContext, args: list[str]) -> None:
         error("No configuration to apply")
         return
 
-    if not CONFIG_AVAILABLE:
+    render_templates, apply_configs = _get_template_renderer() if CONFIG_AVAILABLE else (None, None)
+    if not render_templates:
         error("Configuration module not available")
         return
 
     try:
-        # Load previous config for diffing
-        old_config = None
-        if CONFIG_FILE.exists():
+        # Load previous config for diffing; prefer what this session last applied,
+        # since router.json may hold a config whose apply failed or was declined
+        old_config = ctx.applied_config
+        if old_config is None and CONFIG_FILE.exists():
             try:
                 old_config = load_config(CONFIG_FILE)
             except Exception:
                 pass
 
+        # Nothing changed since the last successful apply: skip the render, write and restart
+        force = bool(args) and args[0] == "force"
+        if not force and ctx.applied_config is not None and ctx.applied_config == ctx.config:
+            ctx.dirty = False
+            log("No changes to apply (use 'apply force' to re-apply)")
+            return
+
         # Save new config and regenerate files
         save_config(ctx.config, CONFIG_FILE)
         ctx.dirty = False
-        ctx.original_json = json.dumps(asdict(ctx.config), sort_keys=True)
         render_templates(ctx.config, TEMPLATE_DIR, GENERATED_DIR)
         apply_configs(GENERATED_DIR)
 
@@ -840,33 +896,36 @@ def cmd_apply(ctx: MenuContext, args: list[str]) -> None:
                         if not success:
                             error("Some changes failed to apply. Manual intervention may be required.")
                             print("You can restart services to apply all changes from config files:")
-                            print(f"  {_get_restart_command()}")
+                            print(f"  {_get_restart_command(ctx.config)}")
                             return
                         else:
                             log("Live changes applied successfully")
                     else:
                         print("Changes saved to config files. Restart services to apply:")
-                        print(f"  {_get_restart_command()}")
+                        print(f"  {_get_restart_command(ctx.config)}")
                         return
 
                 # Handle restart-required changes
                 if restart_reasons:
                     response = input("Restart services for remaining changes? [y/N]: ").strip().lower()
                     if response == 'y':
-                        _restart_services()
+                        if _restart_services(ctx.config):
+                            ctx.applied_config = copy.deepcopy(ctx.config)
                     else:
-                        print(f"Run '{_get_restart_command()}' to apply remaining changes")
+                        print(f"Run '{_get_restart_command(ctx.config)}' to apply remaining changes")
                 else:
                     log("Configuration applied")
+                    ctx.applied_config = copy.deepcopy(ctx.config)
 
             except ImportError:
                 # live_config not available, fall back to restart
                 warn("Live config module not available, falling back to service restart")
                 response = input("Restart services now? [y/N]: ").strip().lower()
                 if response == 'y':
-                    _restart_services()
+                    if _restart_services(ctx.config):
+                        ctx.applied_config = copy.deepcopy(ctx.config)
                 else:
-                    print(f"Run '{_get_restart_command()}' to apply changes")
+                    print(f"Run '{_get_restart_command(ctx.config)}' to apply changes")
 
         else:
             # No previous config - this is first-time setup, must restart
@@ -874,9 +933,10 @@ def cmd_apply(ctx: MenuContext, args: list[str]) -> None:
             print()
             response = input("Start services now? [y/N]: ").strip().lower()
             if response == 'y':
-                _restart_services()
+                if _restart_services(ctx.config):
+                    ctx.applied_config = copy.deepcopy(ctx.config)
             else:
-                print(f"Run '{_get_restart_command()}' to start services")
+                print(f"Run '{_get_restart_command(ctx.config)}' to start services")
 
     except Exception as e:
         error(f"Failed to apply: {e}")
@@ -884,43 +944,39 @@ def cmd_apply(ctx: MenuContext, args: list[str]) -> None:
         traceback.print_exc()
 
 
-def _get_module_services() -> list[str]:
-    """Get list of enabled module service names from config."""
-    if not CONFIG_FILE.exists():
-        return []
-    try:
-        with open(CONFIG_FILE) as f:
-            config = json.load(f)
-        services = []
-        for mod in config.get("modules", []):
-            if mod.get("enabled", False) and mod.get("name"):
-                services.append(f"vpp-{mod['name']}")
-        return services
-    except Exception:
-        return []
+def _get_module_services(config) -> list[str]:
+    """Get list of enabled module service names from the in-memory config."""
+    # cmd_apply has just saved this config, so it matches router.json without re-reading it
+    return [
+        f"vpp-{mod['name']}"
+        for mod in config.modules
+        if mod.get("enabled", False) and mod.get("name")
+    ]
 
 
-def _get_restart_command() -> str:
+def _get_restart_command(config) -> str:
     """Get the full systemctl restart command for all services."""
     base_services = ["vpp-core", "vpp-core-config"]
-    module_services = _get_module_services()
+    module_services = _get_module_services(config)
     all_services = base_services + module_services + ["frr"]
     return "systemctl restart " + " ".join(all_services)
 
 
-def _restart_services() -> None:
-    """Restart all dataplane services in correct order."""
+def _restart_services(config) -> bool:
+    """Restart all dataplane services in correct order. Returns True on success."""
     log("Restarting services...")
-    # Order matters: vpp-core must be up before vpp-core-config, modules, and frr
-    subprocess.run(["systemctl", "restart", "vpp-core"], check=False)
-    subprocess.run(["systemctl", "restart", "vpp-core-config"], check=False)
-
-    # Restart all enabled module services
-    for module_service in _get_module_services():
-        subprocess.run(["systemctl", "restart", module_service], check=False)
-
-    subprocess.run(["systemctl", "restart", "frr"], check=False)
+    # Order matters: vpp-core must be up before vpp-core-config, modules, and frr.
+    # One transaction keeps that order via the units' After= dependencies
+    # (module units are generated with After=vpp-core-config.service).
+    result = subprocess.run(
+        ["systemctl", "restart", "vpp-core", "vpp-core-config", *_get_module_services(config), "frr"],
+        check=False
+    )
+    if result.returncode != 0:
+        error("Service restart failed; check 'systemctl status vpp-core'")
+        return False
     log("Services restarted")
+    return True
 
 
 def cmd_reload(ctx: MenuContext, args: list[str]) -> None:
@@ -938,7 +994,6 @@ def cmd_reload(ctx: MenuContext, args: list[str]) -> None:
     try:
         ctx.config = load_config(CONFIG_FILE)
         ctx.dirty = False
-        ctx.original_json = json.dumps(asdict(ctx.config), sort_keys=True)
         log("Configuration reloaded")
     except Exception as e:
         error(f"Failed to reload: {e}")
@@ -1002,22 +1057,22 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
 
     if command in ("back", ".."):
         if ctx.path:
-            ctx.path.pop()
+            ctx.path = ctx.path[:-1]
         return True
 
     if command in ("home", "/"):
-        ctx.path = []
+        ctx.path = ()
         return True
 
     # Early module command handling - check before global commands when inside a module
     # This allows modules to override commands like "show"
-    if len(ctx.path) >= 3 and ctx.path[:2] == ["config", "modules"] and MODULE_LOADER_AVAILABLE:
+    if len(ctx.path) >= 3 and ctx.path[:2] == ("config", "modules") and MODULE_LOADER_AVAILABLE:
         module_name = ctx.path[2]
         module_cmds = get_module_commands(module_name)
         if module_cmds:
             # Build command path from path beyond module name + command
             module_subpath = ctx.path[3:]
-            path_parts = module_subpath + [command]
+            path_parts = (*module_subpath, command)
             cmd_path = "/".join(path_parts)
 
             # Try to match a module command
@@ -1028,17 +1083,17 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
 
             # Try with first arg appended (e.g., "source add" -> "source/add")
             if args:
-                cmd_path_with_arg = "/".join(module_subpath + [command, args[0]])
+                cmd_path_with_arg = "/".join((*module_subpath, command, args[0]))
                 for mod_cmd in module_cmds:
                     if mod_cmd.path == cmd_path_with_arg:
                         execute_module_command(ctx, module_name, mod_cmd)
                         return True
 
             # Check if command is a submenu prefix - if so, navigate there
-            prefix = "/".join(module_subpath + [command])
+            prefix = "/".join((*module_subpath, command))
             has_subcommands = any(mod_cmd.path.startswith(prefix + "/") for mod_cmd in module_cmds)
             if has_subcommands:
-                ctx.path = ctx.path + [command]
+                ctx.path = ctx.path + (command,)
                 return True
 
     if command == "show":
@@ -1052,9 +1107,9 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
 
     if command == "status":
         # Context-aware status: capture/trace menus show their specific status
-        if ctx.path == ["capture"]:
+        if ctx.path == ("capture",):
             cmd_capture_status(ctx, args)
-        elif ctx.path == ["trace"]:
+        elif ctx.path == ("trace",):
             cmd_trace_status(ctx, args)
         else:
             cmd_status(ctx, args)
@@ -1072,16 +1127,16 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
     if command == "config":
         if not args:
             # Just "config" - navigate there
-            ctx.path = ["config"]
+            ctx.path = ("config",)
             return True
         # Re-invoke handle_command as if we're in config menu
         original_path = ctx.path
-        ctx.path = ["config"]
+        ctx.path = ("config",)
         # Rebuild command from args
         new_cmd = " ".join(args)
         result = handle_command(new_cmd, ctx, menus)
         # If command wasn't recognized and path is still just ["config"], try navigation
-        if ctx.path == ["config"] and args:
+        if ctx.path == ("config",) and args:
             target = args[0].lower()
             if not navigate(ctx, target, menus):
                 # Navigation failed, restore path
@@ -1108,7 +1163,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
         return True
 
     # Shell commands when already in shell menu
-    if path == ["shell"]:
+    if path == ("shell",):
         if command == "routing":
             cmd_shell_routing(ctx, args)
             return True
@@ -1145,7 +1200,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
             return True
 
     # Capture commands when in capture menu
-    if path == ["capture"]:
+    if path == ("capture",):
         if command == "start":
             cmd_capture_start(ctx, args)
             return True
@@ -1188,7 +1243,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
             return True
 
     # Trace commands when in trace menu
-    if path == ["trace"]:
+    if path == ("trace",):
         if command == "start":
             cmd_trace_start(ctx, args)
             return True
@@ -1209,7 +1264,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
     if command == "interfaces" and args and ctx.config:
         subcommand = args[0].lower()
         # Find interface by name
-        iface = next((i for i in ctx.config.interfaces if i.name == subcommand), None)
+        iface = ctx.config.get_interface(subcommand)
         if iface and len(args) >= 2:
             if args[1].lower() == "ospf" and len(args) >= 4 and args[2].lower() == "area":
                 try:
@@ -1315,7 +1370,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
         # Check for loopback instance with ospf command: "loopbacks 0 ospf area 0"
         if ctx.config and subcommand.isdigit():
             instance = int(subcommand)
-            loop = next((l for l in ctx.config.loopbacks if l.instance == instance), None)
+            loop = ctx.config.get_loopback(instance)
             if loop and len(args) >= 2:
                 if args[1].lower() == "ospf" and len(args) >= 4 and args[2].lower() == "area":
                     try:
@@ -1418,7 +1473,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
         # Check for BVI instance with ospf command: "bvi 1 ospf area 0"
         if ctx.config and subcommand.isdigit():
             bridge_id = int(subcommand)
-            bvi = next((b for b in ctx.config.bvi_domains if b.bridge_id == bridge_id), None)
+            bvi = ctx.config.get_bvi(bridge_id)
             if bvi and len(args) >= 2:
                 if args[1].lower() == "ospf" and len(args) >= 4 and args[2].lower() == "area":
                     try:
@@ -1547,7 +1602,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
                             cmd_bgp_peers_remove(ctx, args[3:])
                             return True
                     # Just "routing bgp peers" - navigate there
-                    ctx.path = ["config", "routing", "bgp", "peers"]
+                    ctx.path = ("config", "routing", "bgp", "peers")
                     return True
                 if subcmd == "prefixes":
                     if len(args) > 2:
@@ -1562,10 +1617,10 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
                             cmd_bgp_prefixes_remove(ctx, args[3:])
                             return True
                     # Just "routing bgp prefixes" - navigate there
-                    ctx.path = ["config", "routing", "bgp", "prefixes"]
+                    ctx.path = ("config", "routing", "bgp", "prefixes")
                     return True
             # Just "routing bgp" - navigate there
-            ctx.path = ["config", "routing", "bgp"]
+            ctx.path = ("config", "routing", "bgp")
             return True
         if subcommand == "ospf":
             if len(args) > 1:
@@ -1580,7 +1635,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
                     _show_ospf(ctx.config)
                     return True
             # Just "routing ospf" - navigate there
-            ctx.path = ["config", "routing", "ospf"]
+            ctx.path = ("config", "routing", "ospf")
             return True
         if subcommand == "ospf6":
             if len(args) > 1:
@@ -1595,7 +1650,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
                     _show_ospf6(ctx.config)
                     return True
             # Just "routing ospf6" - navigate there
-            ctx.path = ["config", "routing", "ospf6"]
+            ctx.path = ("config", "routing", "ospf6")
             return True
 
     # Snapshot multi-word commands: "snapshot list", "snapshot create", etc.
@@ -1626,7 +1681,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
         return True
 
     # Interface commands (at config interfaces level)
-    if config_path == ["interfaces"] and ctx.config:
+    if config_path == ("interfaces",) and ctx.config:
         if command == "list" or command == "show":
             _show_interfaces(ctx.config)
             return True
@@ -1635,7 +1690,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
     # Path like ["interfaces", "lan"] -> config_path is ["interfaces", "lan"]
     if len(config_path) == 2 and config_path[0] == "interfaces" and ctx.config:
         iface_name = config_path[1]
-        iface = next((i for i in ctx.config.interfaces if i.name == iface_name), None)
+        iface = ctx.config.get_interface(iface_name)
         if iface:
             # Show command
             if command == "show":
@@ -1765,7 +1820,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
                         return True
 
     # Loopback commands (under config)
-    if config_path == ["loopbacks"]:
+    if config_path == ("loopbacks",):
         if command == "list":
             _show_loopbacks(ctx.config)
             return True
@@ -1780,7 +1835,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
             return True
 
     # BVI commands (under config)
-    if config_path == ["bvi"]:
+    if config_path == ("bvi",):
         if command == "list":
             _show_bvi(ctx.config)
             return True
@@ -1792,7 +1847,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
             return True
 
     # VLAN passthrough commands (under config)
-    if config_path == ["vlan-passthrough"]:
+    if config_path == ("vlan-passthrough",):
         if command == "list":
             _show_vlan_passthrough(ctx.config)
             return True
@@ -1818,7 +1873,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
             return True
 
     # Modules commands (under config)
-    if config_path == ["modules"]:
+    if config_path == ("modules",):
         if command == "available":
             cmd_modules_available(ctx, args)
             return True
@@ -1871,19 +1926,19 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
                             return True
                 else:
                     # Just "modules nat" - navigate there
-                    ctx.path = ["config", "modules", module_name]
+                    ctx.path = ("config", "modules", module_name)
                     return True
 
     # Generic module commands - config modules <module-name> <command>
-    # e.g., config_path=["modules", "nat"], command="set-prefix" -> "set-prefix"
-    # e.g., config_path=["modules", "nat", "mappings"], command="add" -> "mappings/add"
+    # e.g., config_path=("modules", "nat"), command="set-prefix" -> "set-prefix"
+    # e.g., config_path=("modules", "nat", "mappings"), command="add" -> "mappings/add"
     if len(config_path) >= 2 and config_path[0] == "modules" and MODULE_LOADER_AVAILABLE:
         module_name = config_path[1]
         # Try to load module commands
         module_cmds = get_module_commands(module_name)
         if module_cmds:
             # Build command path from remaining path elements + command
-            path_parts = config_path[2:] + [command]
+            path_parts = (*config_path[2:], command)
             cmd_path = "/".join(path_parts)
 
             # Find matching command
@@ -1895,14 +1950,14 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
             # Also try without command if command is a subpath
             # e.g., "mappings" command with "add" arg -> try "mappings/add"
             if args:
-                cmd_path_with_arg = "/".join(config_path[2:] + [command, args[0]])
+                cmd_path_with_arg = "/".join((*config_path[2:], command, args[0]))
                 for mod_cmd in module_cmds:
                     if mod_cmd.path == cmd_path_with_arg:
                         execute_module_command(ctx, module_name, mod_cmd)
                         return True
 
     # BGP commands when at config/routing - handle "bgp <subcommand>" multi-word
-    if config_path == ["routing"] and command == "bgp":
+    if config_path == ("routing",) and command == "bgp":
         if args:
             subcmd = args[0].lower()
             if subcmd == "enable":
@@ -1927,7 +1982,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
                         cmd_bgp_peers_remove(ctx, args[2:])
                         return True
                 # Just "bgp peers" - navigate there
-                ctx.path = ["config", "routing", "bgp", "peers"]
+                ctx.path = ("config", "routing", "bgp", "peers")
                 return True
             if subcmd == "prefixes":
                 if len(args) > 1:
@@ -1942,14 +1997,14 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
                         cmd_bgp_prefixes_remove(ctx, args[2:])
                         return True
                 # Just "bgp prefixes" - navigate there
-                ctx.path = ["config", "routing", "bgp", "prefixes"]
+                ctx.path = ("config", "routing", "bgp", "prefixes")
                 return True
         # Just "bgp" with no args - navigate there
-        ctx.path = ["config", "routing", "bgp"]
+        ctx.path = ("config", "routing", "bgp")
         return True
 
     # BGP commands (under config)
-    if config_path == ["routing", "bgp"]:
+    if config_path == ("routing", "bgp"):
         if command == "enable":
             cmd_bgp_enable(ctx, args)
             return True
@@ -1958,10 +2013,10 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
             return True
         # Navigation to submenus
         if command == "peers" and not args:
-            ctx.path = ["config", "routing", "bgp", "peers"]
+            ctx.path = ("config", "routing", "bgp", "peers")
             return True
         if command == "prefixes" and not args:
-            ctx.path = ["config", "routing", "bgp", "prefixes"]
+            ctx.path = ("config", "routing", "bgp", "prefixes")
             return True
         # Handle "peers add" when in routing/bgp
         if command == "peers" and args:
@@ -1989,7 +2044,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
                 return True
 
     # BGP peer commands (when navigated to config/routing/bgp/peers)
-    if config_path == ["routing", "bgp", "peers"]:
+    if config_path == ("routing", "bgp", "peers"):
         if command == "list":
             cmd_bgp_peers_list(ctx, args)
             return True
@@ -2001,7 +2056,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
             return True
 
     # BGP prefix commands (when navigated to config/routing/bgp/prefixes)
-    if config_path == ["routing", "bgp", "prefixes"]:
+    if config_path == ("routing", "bgp", "prefixes"):
         if command == "list":
             cmd_bgp_prefixes_list(ctx, args)
             return True
@@ -2013,7 +2068,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
             return True
 
     # OSPF commands when at config/routing - handle "ospf <subcommand>" multi-word
-    if config_path == ["routing"] and command == "ospf":
+    if config_path == ("routing",) and command == "ospf":
         if args:
             subcmd = args[0].lower()
             if subcmd == "enable":
@@ -2026,11 +2081,11 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
                 _show_ospf(ctx.config)
                 return True
         # Just "ospf" with no args - navigate there
-        ctx.path = ["config", "routing", "ospf"]
+        ctx.path = ("config", "routing", "ospf")
         return True
 
     # OSPF commands (under config)
-    if config_path == ["routing", "ospf"]:
+    if config_path == ("routing", "ospf"):
         if command == "enable":
             cmd_ospf_enable(ctx, args)
             return True
@@ -2039,7 +2094,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
             return True
 
     # OSPFv3 commands when at config/routing - handle "ospf6 <subcommand>" multi-word
-    if config_path == ["routing"] and command == "ospf6":
+    if config_path == ("routing",) and command == "ospf6":
         if args:
             subcmd = args[0].lower()
             if subcmd == "enable":
@@ -2052,11 +2107,11 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
                 _show_ospf6(ctx.config)
                 return True
         # Just "ospf6" with no args - navigate there
-        ctx.path = ["config", "routing", "ospf6"]
+        ctx.path = ("config", "routing", "ospf6")
         return True
 
     # OSPFv3 commands (under config)
-    if config_path == ["routing", "ospf6"]:
+    if config_path == ("routing", "ospf6"):
         if command == "enable":
             cmd_ospf6_enable(ctx, args)
             return True
@@ -2065,7 +2120,7 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
             return True
 
     # Snapshot commands (when in snapshot menu)
-    if path == ["snapshot"]:
+    if path == ("snapshot",):
         if command == "list":
             cmd_snapshot_list(ctx, args)
             return True
@@ -2100,6 +2155,9 @@ def handle_command(cmd: str, ctx: MenuContext, menus: dict) -> bool:
 
 def run_repl() -> int:
     """Main REPL entry point."""
+    # Decide colors once for the session; buffered show/help output re-decides per block
+    set_color(use_color())
+
     print()
     print(f"{Colors.BOLD}IMP Configuration Manager{Colors.NC}")
     print("Type 'help' for commands, 'exit' to quit")
@@ -2112,7 +2170,6 @@ def run_repl() -> int:
     if CONFIG_AVAILABLE and CONFIG_FILE.exists():
         try:
             ctx.config = load_config(CONFIG_FILE)
-            ctx.original_json = json.dumps(asdict(ctx.config), sort_keys=True)
             info(f"Loaded configuration from {CONFIG_FILE}")
         except Exception as e:
             warn(f"Failed to load config: {e}")
@@ -2139,6 +2196,7 @@ def run_repl() -> int:
     # Main loop
     while True:
         try:
+            ctx.prompt_tick += 1
             prompt = get_prompt_text(ctx)
             cmd = session.prompt(prompt)
 
@@ -27,11 +27,11 @@ VPP_NAT_SOCKET = Path("/run/vpp/nat-cli.sock")
 
 def _get_nat_config(config) -> dict:
     """Get NAT config from modules list, returns dict or empty dict."""
-    if not config or not hasattr(config, 'modules') or not config.modules:
+    if not config:
         return {}
-    for module in config.modules:
-        if module.get('name') == 'nat' and module.get('enabled', False):
-            return module.get('config', {})
+    module = config.get_module('nat')
+    if module and module.get('enabled', False):
+        return module.get('config', {})
     return {}
 
 